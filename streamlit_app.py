@@ -1,12 +1,22 @@
+import hashlib
+import hmac
 import html as html_lib
+import re
+import secrets
+import tempfile
 import threading
+import time
 import uuid
+from functools import lru_cache
 from datetime import datetime, timedelta, time as dtime
+from zoneinfo import ZoneInfo
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-import pytz
 import streamlit as st
 
 import gspread
@@ -16,7 +26,7 @@ from google.oauth2.service_account import Credentials
 # =================================================
 # TIMEZONE
 # =================================================
-TZ = pytz.timezone("US/Eastern")
+TZ = ZoneInfo("America/New_York")
 
 # =================================================
 # CONFIG
@@ -38,16 +48,52 @@ SHEET_LOGS_ARCHIVE = "logs_archive"  # auto-created; permanent history moved out
 ARCHIVE_KEEP_DAYS = 3
 SHEET_SCHEDULE = "schedule"  # auto-created; period start/end times for Period Off deadlines
 
-SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    # Read-only file metadata, used only to ask Drive when the sheet last changed.
+    "https://www.googleapis.com/auth/drive.metadata.readonly",
+]
+DRIVE_FILE_URL = "https://www.googleapis.com/drive/v3/files/{}"
+
+# How often to ask Drive whether the sheet changed. The full tab reads are keyed
+# on the answer, so they only re-download when something was actually written.
+SHEET_REVISION_TTL_SECONDS = 5
+# If Drive cannot be asked (API off, scope not granted), fall back to a blind
+# refetch this often, the same as the old fixed TTL.
+SHEET_FALLBACK_REFRESH_SECONDS = 10
+# Longest a read keyed on one revision is trusted. Drive's modifiedTime can
+# update late, so even with no revision change the tabs are re-read this often
+# and another kiosk's write can never stay hidden for long.
+SHEET_REVISION_MAX_AGE_SECONDS = 60
 
 # Hard timeout on every Google Sheets call, so a slow Google response can never
 # freeze the kiosk on a blank screen. A read taking longer than this is broken
 # anyway, so failing fast and recovering on the next tick beats a long hang.
 SHEETS_TIMEOUT_SECONDS = 10
 
-REASONS = ["Period Off", "Day Off", "Night Off", "Other (type reason)"]
+# Quick retries for Google's transient rate-limit and server errors. Only a
+# 429/5xx answer is retried, never a timeout or dropped connection, so a
+# stalled Google still fails after one SHEETS_TIMEOUT_SECONDS. Only idempotent
+# methods are retried, so an append (POST) is never written twice.
+SHEETS_RETRY_TOTAL = 3
+SHEETS_RETRY_BACKOFF_SECONDS = 0.5
+
+# Local copies of the last good read of each tab, reloaded after a restart.
+# Not st.cache_data(persist="disk"): Streamlit ignores ttl on disk-persisted
+# caches, so the loaders would never refresh. Kept next to this file rather
+# than in the working directory, since whatever is there gets unpickled.
+LAST_GOOD_DIR = Path(__file__).resolve().parent / ".last_good"
+
+# Rows shown in the admin history tables. Streamlit sends the whole frame to
+# the browser on every rerun, so only the newest rows are shown; the downloads
+# and the archive tab keep the full record.
+HISTORY_TABLE_LIMIT = 200
+
+PAGES = ("Sign In / Out", "Who's Out", "Vans", "Admin / History")
 
-VANS = ["Van 1", "Van 2", "Van 3"]
+REASONS = ("Period Off", "Day Off", "Night Off", "Other (type reason)")
+
+VANS = ("Van 1", "Van 2", "Van 3")
 VAN_LABELS = {"Van 1": "Van 1 (White)", "Van 2": "Van 2 (Black)", "Van 3": "Van 3 (Red)"}
 
 
@@ -55,7 +101,7 @@ def van_label(v: str) -> str:
     return VAN_LABELS.get(v, v)
 
 
-VAN_PURPOSES = ["Period Off", "Night Off", "Day Off", "Field Trip", "Tournament", "Other"]
+VAN_PURPOSES = ("Period Off", "Night Off", "Day Off", "Field Trip", "Tournament", "Other")
 
 # Legacy tag from the old auto day-off feature. Kept only so old rows
 # display cleanly on the board. The app no longer writes these rows.
@@ -70,6 +116,10 @@ VANS_HEADERS_REQUIRED = [
 # Logs sheet required headers
 LOGS_HEADERS_REQUIRED = ["id", "timestamp", "name", "reason", "other_reason", "action", "status", "due_back", "late"]
 
+# Low-cardinality columns held as pandas categories once loaded.
+LOGS_CATEGORY_COLUMNS = ("name", "reason", "action", "status")
+VANS_CATEGORY_COLUMNS = ("van", "action", "status", "driver", "purpose", "gas_left")
+
 # -------------------------------------------------
 # LATENESS RULES
 # -------------------------------------------------
@@ -101,12 +151,6 @@ DEFAULT_SCHEDULE = [
 ]
 SCHEDULE_HEADERS = ["period", "start", "end"]
 
-# Pages that auto-refresh for the Big House kiosk. The sign-out form is
-# excluded on purpose so a refresh never wipes a PIN mid-entry.
-# Pages that show the live self-refreshing boards. The Sign In / Out and Admin
-# pages never auto-refresh, so typing is never interrupted.
-KIOSK_PAGES = {"Who's Out", "Vans"}
-
 # =================================================
 # THEME / CSS
 # =================================================
@@ -537,56 +581,6 @@ section[data-testid="stSidebar"] [data-testid="stExpander"] {{
     padding: 0.35rem 1rem;
 }}
 
-.bc-van-card {{
-    background: {WHITE};
-    border: 1px solid var(--line);
-    border-radius: 12px;
-    padding: 1rem 1.1rem;
-    box-shadow: 0 1px 3px rgba(11, 27, 51, 0.06);
-}}
-.bc-van-card.bc-van-out {{
-    background: var(--navy);
-    border-color: var(--navy-deep);
-}}
-.bc-van-card .bc-van-title {{
-    font-family: 'Archivo', sans-serif;
-    font-size: 1.25rem;
-    font-weight: 800;
-    color: var(--navy);
-    margin-bottom: 0.3rem;
-}}
-.bc-van-card.bc-van-out .bc-van-title,
-.bc-van-card.bc-van-out .bc-meta {{
-    color: {WHITE};
-}}
-.bc-van-card.bc-van-out .bc-meta strong {{
-    color: {WHITE};
-}}
-.bc-van-card .bc-meta {{
-    font-size: 0.93rem;
-    color: var(--mist);
-    line-height: 1.5;
-}}
-.bc-van-status {{
-    display: inline-block;
-    font-family: 'Archivo', sans-serif;
-    font-size: 0.7rem;
-    font-weight: 800;
-    letter-spacing: 0.1em;
-    border-radius: 999px;
-    padding: 0.16rem 0.6rem;
-    margin-bottom: 0.4rem;
-}}
-.bc-van-status.in {{
-    background: var(--cloud);
-    color: var(--navy);
-    border: 1px solid var(--line);
-}}
-.bc-van-status.out {{
-    background: {WHITE};
-    color: var(--navy);
-}}
-
 .bc-empty {{
     background: {WHITE};
     border: 1px dashed var(--line);
@@ -596,24 +590,6 @@ section[data-testid="stSidebar"] [data-testid="stExpander"] {{
     font-size: 0.97rem;
 }}
 
-@keyframes bcFlashFade {{
-    0%   {{ opacity: 0; transform: translateY(-4px); }}
-    10%  {{ opacity: 1; transform: translateY(0); }}
-    75%  {{ opacity: 1; }}
-    100% {{ opacity: 0; transform: translateY(-4px); }}
-}}
-.bc-flash {{
-    background: #E7F4EA;
-    border: 1px solid #2E7D32;
-    color: #1B5E20;
-    border-radius: 10px;
-    padding: 0.7rem 1rem;
-    font-family: 'Public Sans', sans-serif;
-    font-weight: 600;
-    margin-bottom: 0.6rem;
-    animation: bcFlashFade 2.4s ease forwards;
-}}
-
 .bc-footer {{
     margin-top: 2.5rem;
     padding-top: 0.8rem;
@@ -671,11 +647,6 @@ def empty_note(text: str):
     st.markdown(f"<div class='bc-empty'>{esc(text)}</div>", unsafe_allow_html=True)
 
 
-def flash_banner(msg: str):
-    """Inline green confirmation that fades out on its own after ~2 seconds."""
-    st.markdown(f"<div class='bc-flash'>{esc(msg)}</div>", unsafe_allow_html=True)
-
-
 def big_flash(msg: str, kind: str = "in", word: str = "", ask: str = ""):
     """Loud confirmation banner. Does NOT fade.
 
@@ -709,6 +680,10 @@ def crest_footer():
 # =================================================
 # SMALL UTILS
 # =================================================
+# A code Sheets stored as a number comes back as "123.0".
+_PIN_FLOAT_SUFFIX = re.compile(r"\.0$")
+
+
 def normalize_pin(pin: str) -> str:
     s = str(pin).strip().replace(" ", "")
     if s.endswith(".0"):
@@ -716,16 +691,92 @@ def normalize_pin(pin: str) -> str:
     return s.zfill(4)
 
 
+def normalize_pin_series(pins: pd.Series) -> pd.Series:
+    """normalize_pin over a whole column in a few vectorized string passes."""
+    return (
+        pins.astype(str)
+        .str.strip()
+        .str.replace(" ", "", regex=False)
+        .str.replace(_PIN_FLOAT_SUFFIX, "", regex=True)
+        .str.zfill(4)
+    )
+
+
+def clean_category(values: pd.Series, upper: bool = False) -> pd.Series:
+    """Strip (and optionally upper-case) a repetitive text column into a category.
+
+    The column is factorized first, so the string clean-up runs once per
+    distinct value (a few reasons, IN/OUT, the roster) rather than once per
+    row, and the category is built straight from the cleaned codes.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    cleaned = pd.Index(uniques).astype(str).str.strip()
+    if upper:
+        cleaned = cleaned.str.upper()
+    return pd.Series(pd.Categorical(cleaned.take(codes)), index=values.index, name=values.name)
+
+
+ADMIN_TIME_FORMAT = "%Y-%m-%d %I:%M %p"
+
+
 def format_time(dt):
     """Full timestamp for admin tables."""
     if pd.isna(dt):
         return ""
     try:
-        return dt.strftime("%Y-%m-%d %I:%M %p")
+        return dt.strftime(ADMIN_TIME_FORMAT)
     except Exception:
         return str(dt)
 
 
+# An ISO 8601 string that carries its own UTC offset.
+_ISO_OFFSET_SUFFIX = re.compile(r"(?:Z|[+-]\d\d:?\d\d)$")
+
+
+def parse_timestamps(values: pd.Series) -> pd.Series:
+    """Parse stored ISO 8601 timestamps into one camp-time datetime64 column.
+
+    Rows are written with isoformat(), so their offset is -04:00 in summer
+    and -05:00 in winter. Parsed as-is, a log that spans a DST change has
+    mixed offsets, which pandas refuses to put in one column. Going through
+    UTC and converting to camp time keeps the column datetime64 whatever the
+    offsets, so the formatters and sorts below always take their vectorized
+    path. A hand-typed row with no offset is read as camp time. cache=True
+    parses each distinct string once.
+    """
+    text = values.astype(str).str.strip()
+    has_offset = text.str.contains(_ISO_OFFSET_SUFFIX)
+    out = pd.to_datetime(text.where(has_offset), errors="coerce", format="ISO8601", utc=True, cache=True)
+    out = out.dt.tz_convert(TZ)
+    if not has_offset.all():
+        naive = pd.to_datetime(text.where(~has_offset), errors="coerce", format="ISO8601", cache=True)
+        out = out.fillna(naive.dt.tz_localize(TZ, ambiguous="NaT", nonexistent="NaT"))
+    return out
+
+
+def format_time_series(ts: pd.Series) -> pd.Series:
+    """format_time over a whole column in one vectorized pass.
+
+    A parsed datetime column is formatted by pandas in one go instead of a
+    Python strftime call per row. Anything else (a column left as objects,
+    say, by mixed UTC offsets) falls back to the per-value formatter.
+    """
+    if pd.api.types.is_datetime64_any_dtype(ts):
+        return ts.dt.strftime(ADMIN_TIME_FORMAT).fillna("")
+    return ts.apply(format_time)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def frame_csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV bytes for a download button.
+
+    Download buttons need their data on every render, clicked or not. Keyed on
+    the frame's contents, an admin page rerun with unchanged data reuses the
+    bytes instead of serializing the table again.
+    """
+    return df.to_csv(index=False).encode("utf-8")
+
+
 def format_board_time(dt):
     """Short timestamp for the public board: time only if today, else day + time."""
     if pd.isna(dt):
@@ -739,8 +790,21 @@ def format_board_time(dt):
         return str(dt)
 
 
+def format_board_time_series(ts: pd.Series) -> pd.Series:
+    """format_board_time over a whole column, with no per-row NaT check.
+
+    Both forms are formatted for every row in one vectorized pass each, then
+    picked per row by whether it is today. Blank where there is no time.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(ts):
+        return ts.apply(format_board_time)
+    today = ts.dt.date == datetime.now(TZ).date()
+    short = ts.dt.strftime("%I:%M %p").str.lstrip("0")
+    long = ts.dt.strftime("%a %I:%M %p").str.replace(" 0", " ", regex=False)
+    return short.where(today, long).fillna("")
+
+
 BOARD_REFRESH_SECONDS = 60
-SCREEN_REFRESH_SECONDS = 20
 
 # If the kiosk is left on a display page (Who's Out or Vans) and untouched for
 # this long, it returns itself to the Sign In / Out screen. The whole system
@@ -751,24 +815,32 @@ SCREEN_REFRESH_SECONDS = 20
 IDLE_RETURN_SECONDS = 120
 
 
+WEEKDAY_ALIASES = {
+    "mon": "monday", "monday": "monday",
+    "tue": "tuesday", "tues": "tuesday", "tuesday": "tuesday",
+    "wed": "wednesday", "weds": "wednesday", "wednesday": "wednesday",
+    "thu": "thursday", "thur": "thursday", "thurs": "thursday", "thursday": "thursday",
+    "fri": "friday", "friday": "friday",
+    "sat": "saturday", "saturday": "saturday",
+    "sun": "sunday", "sunday": "sunday",
+}
+
+
 def normalize_weekday(s: str) -> str:
     """Normalize weekday strings like 'Mon', 'monday', 'MONDAY' -> 'monday'."""
     s = (s or "").strip().lower()
-    mapping = {
-        "mon": "monday", "monday": "monday",
-        "tue": "tuesday", "tues": "tuesday", "tuesday": "tuesday",
-        "wed": "wednesday", "weds": "wednesday", "wednesday": "wednesday",
-        "thu": "thursday", "thur": "thursday", "thurs": "thursday", "thursday": "thursday",
-        "fri": "friday", "friday": "friday",
-        "sat": "saturday", "saturday": "saturday",
-        "sun": "sunday", "sunday": "sunday",
-    }
-    return mapping.get(s, s)
+    return WEEKDAY_ALIASES.get(s, s)
+
+
+def normalize_weekday_series(days: pd.Series) -> pd.Series:
+    """normalize_weekday over a whole column, without a Python call per row."""
+    s = days.astype(str).str.strip().str.lower()
+    return s.map(WEEKDAY_ALIASES).fillna(s)
 
 # =================================================
 # GOOGLE SHEETS HELPERS
 # =================================================
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def get_gspread_client():
     creds_info = dict(st.secrets["gcp_service_account"])
     creds = Credentials.from_service_account_info(creds_info, scopes=SCOPES)
@@ -784,26 +856,227 @@ def get_gspread_client():
             client.http_client.timeout = SHEETS_TIMEOUT_SECONDS
         except Exception:
             pass
+    # The client is cached for the process, so its session's keep-alive pool
+    # is reused by every call. A larger pool lets the board fragments and a
+    # kiosk's own reads share connections instead of opening new ones.
+    try:
+        retry = Retry(
+            total=SHEETS_RETRY_TOTAL,
+            backoff_factor=SHEETS_RETRY_BACKOFF_SECONDS,
+            # No retries on read or connect failures: each would wait out the
+            # full timeout again, turning one stall into several.
+            connect=0,
+            read=0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=False,
+            # Hand the last response back once retries run out, so gspread
+            # still raises its usual APIError and every handler still works.
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        client.http_client.session.mount("https://", adapter)
+    except Exception:
+        pass
     return client
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def get_spreadsheet():
     client = get_gspread_client()
     return client.open_by_key(SPREADSHEET_ID)
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
+def get_worksheet_map() -> dict:
+    """Handles to every tab, keyed by title, from one metadata call.
+
+    gspread's worksheet(name) hits the network to look up the tab every call,
+    so caching one handle per name still cost a round-trip for each tab the
+    first time it was used. worksheets() returns them all at once. The handles
+    stay valid for the whole process; actual reads/writes still hit the live
+    sheet.
+    """
+    return {ws.title: ws for ws in get_spreadsheet().worksheets()}
+
+
 def get_worksheet(name: str):
     """Return a cached handle to a worksheet.
 
-    gspread's worksheet(name) hits the network to look up the tab every call.
-    Caching the handle removes that round-trip from every read and write. The
-    handle stays valid for the whole session; actual reads/writes still hit
-    the live sheet.
+    A miss refreshes the map once, so a tab added by hand in Google Sheets is
+    still found. Raises WorksheetNotFound like gspread if it truly is not there.
     """
-    ss = get_spreadsheet()
-    return ss.worksheet(name)
+    ws = get_worksheet_map().get(name)
+    if ws is None:
+        get_worksheet_map.clear()
+        ws = get_worksheet_map().get(name)
+    if ws is None:
+        raise WorksheetNotFound(name)
+    return ws
+
+
+@st.cache_resource(show_spinner=False)
+def get_last_good_reads() -> dict:
+    """Last successful read of each tab, shared by every kiosk on the server.
+
+    A rate limit or a momentary 503 from Google used to blank the board (logs
+    came back empty) or crash the page (roster, vans). The loaders below save
+    each good read here and fall back to it when a fetch fails, so the kiosk
+    keeps showing the last known OUT list until Google answers again.
+
+    Seeded from the copies on disk, so an app that restarts while Google is
+    unhappy still has something to show.
+    """
+    store = {}
+    for f in LAST_GOOD_DIR.glob("*.pkl"):
+        try:
+            # Through last_good_disk_copy again, so a copy saved before codes
+            # were kept off disk still loads without them.
+            store[f.stem] = last_good_disk_copy(f.stem, pd.read_pickle(f))
+        except Exception:
+            pass
+    return store
+
+
+@st.cache_resource(show_spinner=False)
+def get_last_good_revisions() -> dict:
+    """(revision, read time) of each last good read, seeded from disk."""
+    revs = {}
+    for f in LAST_GOOD_DIR.glob("*.rev"):
+        if f.stem == "roster":
+            continue  # the disk roster has no codes; never serve it as current
+        try:
+            revs[f.stem] = (f.read_text().strip(), f.stat().st_mtime)
+        except Exception:
+            pass
+    return revs
+
+
+def last_good_disk_copy(key: str, value):
+    """The part of a good read that may be written to disk.
+
+    Staff codes never are: the roster is saved without its pin column, so a
+    roster reloaded after a restart shows names but accepts no codes until
+    the sheet answers again.
+    """
+    if key != "roster":
+        return value
+    staff, drivers = value
+    return staff.drop(columns=["pin"], errors="ignore"), drivers
+
+
+def write_file_atomic(path: Path, write):
+    """Write through a uniquely named temp file and swap it in, so a crash or
+    a second session saving the same key never leaves a half-written file."""
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False) as f:
+        tmp = Path(f.name)
+        try:
+            write(f)
+        except Exception:
+            f.close()
+            tmp.unlink(missing_ok=True)
+            raise
+    tmp.replace(path)
+
+
+def remember_good_read(key: str, value, revision: str = ""):
+    get_last_good_reads()[key] = value
+    get_last_good_revisions()[key] = (revision, time.time())
+    # Best effort disk copy. The revision goes down after the pickle, so it
+    # never vouches for older data. The roster's is not saved at all: its disk
+    # copy has no codes, so it must never pass for the current roster.
+    try:
+        LAST_GOOD_DIR.mkdir(exist_ok=True)
+        write_file_atomic(LAST_GOOD_DIR / f"{key}.pkl", lambda f: pd.to_pickle(last_good_disk_copy(key, value), f))
+        if key != "roster":
+            write_file_atomic(LAST_GOOD_DIR / f"{key}.rev", lambda f: f.write(revision.encode()))
+    except Exception:
+        pass
+    return value
+
+
+def forget_good_revision(key: str):
+    """Stop last_good_at vouching for key. Called on every cache clear: Drive's
+    modifiedTime can lag a write, and a clear must force a real re-read."""
+    get_last_good_revisions()[key] = ("", 0.0)
+    try:
+        (LAST_GOOD_DIR / f"{key}.rev").unlink(missing_ok=True)
+    except Exception:
+        pass
+
+
+def last_good_at(key: str, revision: str):
+    """The saved read of key if it was taken at exactly this sheet revision,
+    within the last SHEET_REVISION_MAX_AGE_SECONDS.
+
+    The revision only changes when the sheet does, so a match means the copy
+    is current, as long as Drive reported the change on time. The age bound
+    covers the case where it did not. After a quick restart the tab is served
+    from disk with no download and no re-parse. A time bucket key (no revision
+    available) never matches.
+    """
+    if not revision or revision.startswith("t"):
+        return None
+    saved_rev, saved_at = get_last_good_revisions().get(key, ("", 0.0))
+    if saved_rev != revision or time.time() - saved_at > SHEET_REVISION_MAX_AGE_SECONDS:
+        return None
+    return get_last_good_reads().get(key)
+
+
+@st.cache_data(ttl=SHEET_REVISION_TTL_SECONDS, show_spinner=False)
+def get_sheet_revision() -> str:
+    """The spreadsheet's Drive modifiedTime, or "" if Drive can't be asked.
+
+    One tiny metadata call instead of re-downloading whole tabs: loaders keyed
+    on this value are served from cache until someone writes to the sheet.
+    """
+    try:
+        resp = get_gspread_client().http_client.request(
+            "get", DRIVE_FILE_URL.format(SPREADSHEET_ID), params={"fields": "modifiedTime"}
+        )
+        return str(resp.json().get("modifiedTime", ""))
+    except Exception:
+        return ""
+
+
+def sheet_cache_key() -> str:
+    """Cache key for the tab loaders: the sheet revision when known, otherwise
+    a time bucket so the loaders still refresh on the old fixed schedule."""
+    return get_sheet_revision() or f"t{int(time.time() // SHEET_FALLBACK_REFRESH_SECONDS)}"
+
+
+def append_sheet_rows(sheet, rows: list):
+    """Append rows to the end of a tab in a single values.append call.
+
+    Every write in the app goes through here, one row or a whole van at once,
+    so a write is always exactly one round-trip and never a per-row loop.
+    RAW keeps the stored text exactly as written; Sheets never reinterprets a
+    timestamp or a leading-zero code as a date or a number. table_range A1
+    anchors the table lookup at the header instead of letting Sheets hunt for
+    a table across the whole tab, and INSERT_ROWS adds fresh rows under it,
+    so an append never overwrites stray cells sitting below the data.
+    """
+    if not rows:
+        return None
+    return sheet.append_rows(
+        rows,
+        value_input_option="RAW",
+        insert_data_option="INSERT_ROWS",
+        table_range="A1",
+    )
+
+
+def rewrite_header_row(sheet, old_headers: list, new_headers: list):
+    """Overwrite row 1 in place with one values.update call.
+
+    Replaces delete_rows(1) + insert_row, two writes where one will do. The
+    row is padded with blanks out to the old width so no stale header cell is
+    left behind, and the grid is widened first only if the header outgrew it.
+    """
+    width = max(len(old_headers), len(new_headers))
+    if width > sheet.col_count:
+        sheet.add_cols(width - sheet.col_count)
+    row = [str(h) for h in new_headers] + [""] * (width - len(new_headers))
+    sheet.update(range_name="A1", values=[row])
 
 
 def get_settings_sheet():
@@ -816,7 +1089,7 @@ def get_settings_sheet():
         sheet.update("A1:B2", [["key", "value"], ["emergency", "FALSE"]])
         # Drop the cached lookup so the next call finds the new tab.
         try:
-            get_worksheet.clear()
+            get_worksheet_map.clear()
         except Exception:
             pass
         return sheet
@@ -826,38 +1099,53 @@ def set_setting(key: str, value: str):
     """Write any key/value into the settings tab."""
     try:
         sheet = get_settings_sheet()
-        # Match the KEY column only. A whole-sheet find could land on the same
-        # text sitting in a value cell and overwrite the wrong row.
-        try:
-            cell = sheet.find(key, in_column=1)
-        except TypeError:
-            cell = sheet.find(key)
-            if cell and cell.col != 1:
-                cell = None
-        if cell and cell.col == 1:
-            sheet.update_cell(cell.row, 2, value)
+        # Match the KEY column only, read on its own. A whole-sheet find could
+        # land on the same text sitting in a value cell and overwrite the
+        # wrong row, and it downloads every cell to do it.
+        rows = find_rows_by_id(sheet, 1, [key])
+        if rows:
+            sheet.update_cell(rows[0], 2, value)
         else:
-            sheet.append_row([key, value])
-        get_setting.clear()
+            append_sheet_rows(sheet, [[key, value]])
+        clear_settings_cache()
     except Exception:
         pass
 
 
-@st.cache_data(ttl=30)
+@st.cache_data(ttl=SHEET_REVISION_MAX_AGE_SECONDS, max_entries=4, show_spinner=False)
+def load_settings_at(revision: str) -> dict:
+    """Every key/value in the settings tab as of one sheet revision.
+
+    One read serves every key; each key used to fetch the tab on its own.
+    Keys are matched case-insensitively, and the first row wins if a key is
+    listed twice.
+    """
+    # Only the key and value columns, never any notes kept off to the side.
+    df = frame_from_values(get_settings_sheet().get("A:B"))
+    if df.empty or "key" not in df.columns or "value" not in df.columns:
+        return {}
+    settings = {}
+    keys = df["key"].astype(str).str.strip().str.lower()
+    for k, v in zip(keys, df["value"].astype(str).str.strip()):
+        settings.setdefault(k, v)
+    return settings
+
+
 def get_setting(key: str) -> str:
     """Read any key from the settings tab. Blank if missing."""
     try:
-        df = read_sheet_df(get_settings_sheet())
-        if df.empty or "key" not in df.columns or "value" not in df.columns:
-            return ""
-        row = df[df["key"].astype(str).str.strip().str.lower() == key.strip().lower()]
-        if row.empty:
-            return ""
-        return str(row.iloc[0]["value"]).strip()
+        return load_settings_at(sheet_cache_key()).get(key.strip().lower(), "")
     except Exception:
         return ""
 
 
+def clear_settings_cache():
+    """Force the next get_setting to read the tab, not the cached revision.
+    Used before the alert dedupe reads, which must see other kiosks' writes."""
+    get_sheet_revision.clear()
+    load_settings_at.clear()
+
+
 # =================================================
 # SCHEDULE + LATENESS
 # =================================================
@@ -871,7 +1159,7 @@ def get_schedule_sheet():
         rows = [SCHEDULE_HEADERS] + [list(p) for p in DEFAULT_SCHEDULE]
         sheet.update(f"A1:C{len(rows)}", rows)
         try:
-            get_worksheet.clear()
+            get_worksheet_map.clear()
         except Exception:
             pass
         return sheet
@@ -879,7 +1167,13 @@ def get_schedule_sheet():
 
 def _parse_hhmm(s: str):
     """Parse '9:15', '09:15', or '14:15' into a time. None if unusable."""
-    s = str(s or "").strip()
+    return _parse_hhmm_text(str(s or "").strip())
+
+
+@lru_cache(maxsize=256)
+def _parse_hhmm_text(s: str):
+    # The schedule holds a dozen distinct times, parsed again on every reload
+    # of the tab; each one goes through strptime's format machinery only once.
     if not s:
         return None
     for fmt in ("%H:%M", "%I:%M %p", "%I:%M%p", "%H:%M:%S"):
@@ -890,7 +1184,22 @@ def _parse_hhmm(s: str):
     return None
 
 
-@st.cache_data(ttl=120)
+@st.cache_data(ttl=SHEET_REVISION_MAX_AGE_SECONDS, max_entries=4, show_spinner=False)
+def load_schedule_at(revision: str):
+    """The schedule tab's usable periods as of one sheet revision, sorted.
+    Raises if the read fails, so a failure is never cached as "no periods"."""
+    df = read_sheet_df(get_schedule_sheet())
+    periods = []
+    if not df.empty and "start" in df.columns and "end" in df.columns:
+        for r in df.to_dict("records"):
+            start = _parse_hhmm(r.get("start"))
+            end = _parse_hhmm(r.get("end"))
+            nm = str(r.get("period", "")).strip()
+            if start and end:
+                periods.append((nm, start, end))
+    return sorted(periods, key=lambda p: p[1])
+
+
 def load_schedule():
     """Return the day's periods as [(name, start_time, end_time)], sorted.
 
@@ -899,19 +1208,18 @@ def load_schedule():
     empty, or unreadable, so lateness never silently stops working.
     """
     try:
-        df = read_sheet_df(get_schedule_sheet())
-        periods = []
-        if not df.empty and "start" in df.columns and "end" in df.columns:
-            for _, r in df.iterrows():
-                start = _parse_hhmm(r.get("start"))
-                end = _parse_hhmm(r.get("end"))
-                nm = str(r.get("period", "")).strip()
-                if start and end:
-                    periods.append((nm, start, end))
+        periods = load_schedule_at(sheet_cache_key())
         if periods:
-            return sorted(periods, key=lambda p: p[1])
+            return periods
     except Exception:
         pass
+    return default_periods()
+
+
+@lru_cache(maxsize=1)
+def default_periods() -> list:
+    """DEFAULT_SCHEDULE parsed and sorted, once per process. The fallback is
+    read on every deadline check while the tab is unavailable."""
     return sorted(
         [(n, _parse_hhmm(s), _parse_hhmm(e)) for n, s, e in DEFAULT_SCHEDULE],
         key=lambda p: p[1],
@@ -949,14 +1257,14 @@ def compute_due_back(reason: str, now: datetime):
         due_date = day_off_date + timedelta(days=1)
         hh, mm = DAY_OFF_DUE
         naive = datetime.combine(due_date, dtime(hh, mm))
-        return TZ.localize(naive) if now.tzinfo else naive
+        return naive.replace(tzinfo=TZ) if now.tzinfo else naive
 
     if reason == "Period Off":
         today = now.date()
         for _name, start, end in load_schedule():
             if not start or not end:
                 continue
-            end_dt = TZ.localize(datetime.combine(today, end)) if now.tzinfo else datetime.combine(today, end)
+            end_dt = datetime.combine(today, end, tzinfo=TZ) if now.tzinfo else datetime.combine(today, end)
             due = end_dt - timedelta(minutes=PERIOD_OFF_GRACE_MIN)
             # The first period whose deadline is still ahead of them is theirs.
             # That covers being mid-period and being in a gap between periods.
@@ -969,7 +1277,14 @@ def compute_due_back(reason: str, now: datetime):
 
 def parse_due(s):
     """Parse a stored due_back string back into an aware datetime, or None."""
-    s = str(s or "").strip()
+    return _parse_due_text(str(s or "").strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_due_text(s: str):
+    # Board ticks, lateness checks and the archive planner parse the same
+    # stored timestamps over and over. A scalar pd.to_datetime is slow, and the
+    # result is an immutable datetime, so each distinct string is parsed once.
     if not s:
         return None
     try:
@@ -978,7 +1293,7 @@ def parse_due(s):
             return None
         dt = dt.to_pydatetime()
         if dt.tzinfo is None:
-            dt = TZ.localize(dt)
+            dt = dt.replace(tzinfo=TZ)
         return dt
     except Exception:
         return None
@@ -1001,11 +1316,30 @@ def effective_due_back(reason, signed_out_at):
 
 
 def row_minutes_late(row, when=None) -> int:
-    """Minutes late for a log row, recomputing the deadline from its reason."""
+    """Minutes late for a log row, recomputing the deadline from its reason.
+
+    A row that already carries mins_late (see with_minutes_late) is not worked
+    out again, unless the caller asks about a specific moment.
+    """
+    if when is None:
+        pre = row.get("mins_late")
+        if pre is not None and not pd.isna(pre):
+            return int(pre)
     due = effective_due_back(row.get("reason", ""), row.get("timestamp", ""))
     return minutes_late(due, when)
 
 
+def with_minutes_late(df_out: pd.DataFrame, when=None) -> pd.DataFrame:
+    """df_out plus a mins_late column, computed once per person.
+
+    The board splits on lateness, draws a chip from it and alerts on it. Each
+    used to recompute every deadline; computing it here once per render lets
+    all of them read the same number.
+    """
+    when = when or datetime.now(TZ)
+    return df_out.assign(mins_late=[row_minutes_late(r, when) for r in df_out.to_dict("records")])
+
+
 def minutes_late(due, when=None) -> int:
     """How many whole minutes past the deadline. 0 if not late or no deadline."""
     if not due:
@@ -1016,9 +1350,9 @@ def minutes_late(due, when=None) -> int:
     # anything naive to camp time so the comparison is always valid.
     try:
         if due.tzinfo is None:
-            due = TZ.localize(due)
+            due = due.replace(tzinfo=TZ)
         if when.tzinfo is None:
-            when = TZ.localize(when)
+            when = when.replace(tzinfo=TZ)
     except Exception:
         return 0
     delta = (when - due).total_seconds()
@@ -1084,7 +1418,7 @@ def check_late_and_alert(df_out: pd.DataFrame):
         # Read the dedupe list FRESH. A stale read here means two screens can
         # both decide nobody has been alerted yet and both fire.
         try:
-            get_setting.clear()
+            clear_settings_cache()
         except Exception:
             pass
 
@@ -1093,7 +1427,7 @@ def check_late_and_alert(df_out: pd.DataFrame):
         already = set(already_list)
 
         new_alerts = []
-        for _, row in df_out.iterrows():
+        for row in df_out.to_dict("records"):
             rid = str(row.get("id", "")).strip()
             mins = row_minutes_late(row)
             if mins > 0 and rid and rid not in already:
@@ -1134,7 +1468,7 @@ def check_nightly_summary(df_out: pd.DataFrame):
 
         today = now.strftime("%Y-%m-%d")
         try:
-            get_setting.clear()
+            clear_settings_cache()
         except Exception:
             pass
         if get_setting(NIGHTLY_SUMMARY_KEY).strip() == today:
@@ -1148,11 +1482,9 @@ def check_nightly_summary(df_out: pd.DataFrame):
             notify_phone("Bauercrest: Nightly check", "All staff are signed IN. Nobody is out.")
             return
 
-        people = []
-        for _, row in df_out.iterrows():
-            nm = str(row.get("name", "")).strip()
-            rs = str(row.get("reason", "")).strip()
-            people.append(f"{nm} ({rs})" if rs else nm)
+        names = df_out["name"].astype(str).str.strip()
+        reasons = df_out["reason"].astype(str).str.strip()
+        people = [f"{nm} ({rs})" if rs else nm for nm, rs in zip(names, reasons)]
 
         body = f"{len(people)} still signed OUT: " + ", ".join(people)
         notify_phone("Bauercrest: Still out tonight", body[:1500])
@@ -1169,7 +1501,15 @@ def read_sheet_df(sheet) -> pd.DataFrame:
     non-blank, and never throws, so the app stays up no matter the sheet's
     state. Extra de-duplicated columns are harmless and ignored downstream.
     """
-    values = sheet.get_all_values()
+    return frame_from_values(sheet.get_all_values())
+
+
+def frame_from_values(values) -> pd.DataFrame:
+    """Build a DataFrame from a raw 2-D cell list, header in the first row.
+
+    Shared by the single-tab reader and the batched reader, so both get the
+    same unique, non-blank headers and the same padded/trimmed row widths.
+    """
     if not values:
         return pd.DataFrame()
 
@@ -1187,67 +1527,158 @@ def read_sheet_df(sheet) -> pd.DataFrame:
             seen[name] = 0
         headers.append(name)
 
-    body = values[1:]
+    # Sheets drops trailing blank cells, so rows come back ragged. pandas
+    # builds the ragged frame in C (short rows padded with missing values);
+    # reindex then trims or widens it to the header in one step, instead of
+    # padding and slicing every row in Python.
     width = len(headers)
-    norm = []
-    for r in body:
-        r = list(r)
-        if len(r) < width:
-            r = r + [""] * (width - len(r))
-        elif len(r) > width:
-            r = r[:width]
-        norm.append(r)
+    df = pd.DataFrame(values[1:]).reindex(columns=range(width)).fillna("")
+    df.columns = headers
+    return df.astype({h: str for h, dt in zip(headers, df.dtypes) if dt == object})
+
+
+def read_sheets_batch(names) -> dict:
+    """Read several tabs in ONE API call. Returns {tab name: DataFrame}.
+
+    Each read_sheet_df is a separate round-trip to Google, and the slow part of
+    every page load is waiting on the network, not parsing. values_batch_get
+    fetches all the named tabs in a single request, so tabs that are always
+    needed together cost one round-trip instead of one each.
+    """
+    names = list(names)
+    resp = get_spreadsheet().values_batch_get([f"'{n}'" for n in names])
+    ranges = resp.get("valueRanges", [])
+    frames = {}
+    for i, n in enumerate(names):
+        values = ranges[i].get("values", []) if i < len(ranges) else []
+        frames[n] = frame_from_values(values)
+    return frames
 
-    return pd.DataFrame(norm, columns=headers)
+
+# Tabs every page reads. A write to any tab moves the revision for all of
+# them at once, so they are fetched together.
+CORE_SHEETS = (SHEET_STAFF, SHEET_DRIVERS, SHEET_LOGS, SHEET_VANS)
+
+
+@st.cache_data(ttl=60, max_entries=2, show_spinner=False)
+def load_core_frames_at(revision: str) -> dict:
+    """Raw staff, drivers, logs and vans tabs as of one revision, in one read.
+
+    The revision is the whole spreadsheet's, so after any sign-in or van log
+    the roster, logs and vans loaders all miss together. Sharing one batched
+    read means that costs one round-trip instead of one per tab. Short-lived:
+    the per-tab loaders keep the parsed frames.
+    """
+    return read_sheets_batch(CORE_SHEETS)
+
+
+def core_frame_at(revision: str, name: str) -> pd.DataFrame:
+    """One tab from the shared batched read.
+
+    If Google rejects the batch itself (a 400, e.g. one tab missing or
+    renamed), just this tab is read, so one broken tab cannot take the others
+    down with it. Any other failure (timeout, rate limit, outage) is raised
+    as is: reading again right away would only wait out the same stall.
+    """
+    try:
+        return load_core_frames_at(revision)[name]
+    except APIError as e:
+        if getattr(e, "code", None) != 400:
+            raise
+        return read_sheet_df(get_worksheet(name))
 
 # =================================================
 # STAFF + DRIVERS (FROM SHEETS)
 # =================================================
-@st.cache_data(ttl=30)
+# Spellings of "yes" accepted in the roster's checkbox-style columns.
+YES_WORDS = frozenset({"TRUE", "1", "YES", "Y"})
+
+
+@st.cache_data(ttl=SHEET_REVISION_MAX_AGE_SECONDS, max_entries=4, show_spinner=False)
+def load_roster_frames_at(revision: str):
+    """Raw staff and drivers tabs as of one sheet revision, in one batched read.
+
+    Every page needs both (codes and the driver list), so they come from the
+    same batched read as the logs and vans. Keyed on the revision like the
+    logs, so an unchanged roster is never downloaded twice.
+    """
+    saved = last_good_at("roster", revision)
+    if saved is not None:
+        return saved
+    frames = (core_frame_at(revision, SHEET_STAFF), core_frame_at(revision, SHEET_DRIVERS))
+    return remember_good_read("roster", frames, revision)
+
+
+def load_roster_frames_cached():
+    """The two loaders below share this."""
+    try:
+        return load_roster_frames_at(sheet_cache_key())
+    except Exception:
+        last = get_last_good_reads().get("roster")
+        if last is None:
+            raise
+        return last[0].copy(), last[1].copy()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
 def load_staff_df_cached():
-    sheet = get_worksheet(SHEET_STAFF)
-    df = read_sheet_df(sheet)
+    df = load_roster_frames_cached()[0]
+    # A missing pin column (the disk copy, which never holds codes) means no
+    # codes at all, not everyone on the padded blank code.
+    has_pins = "pin" in df.columns
     for c in ["name", "pin", "active", "admin"]:
         if c not in df.columns:
             df[c] = ""
 
-    df["name"] = df["name"].astype(str).str.strip()
-    df["pin"] = df["pin"].astype(str).str.strip().apply(normalize_pin)
-
-    # active: treat blank as TRUE
-    a = df["active"].astype(str).str.upper().str.strip()
-    df["active"] = a.isin(["TRUE", "1", "YES", "Y", ""])
-
-    # admin: only explicit TRUE counts. Blank means not an admin.
-    adm = df["admin"].astype(str).str.upper().str.strip()
-    df["admin"] = adm.isin(["TRUE", "1", "YES", "Y"])
-
-    df = df[df["name"] != ""].copy()
-    return df
+    # One assign and one filter, instead of overwriting column by column and
+    # then copying the filtered frame.
+    df = df.assign(
+        name=df["name"].astype(str).str.strip(),
+        pin=normalize_pin_series(df["pin"]) if has_pins else "",
+        # active: treat blank as TRUE
+        active=df["active"].astype(str).str.upper().str.strip().isin(YES_WORDS | {""}),
+        # admin: only explicit TRUE counts. Blank means not an admin.
+        admin=df["admin"].astype(str).str.upper().str.strip().isin(YES_WORDS),
+    )
+    return df[df["name"] != ""]
 
 
-@st.cache_data(ttl=30)
+@st.cache_data(ttl=30, show_spinner=False)
 def load_drivers_df_cached():
-    sheet = get_worksheet(SHEET_DRIVERS)
-    df = read_sheet_df(sheet)
+    df = load_roster_frames_cached()[1]
     for c in ["name", "passed_test"]:
         if c not in df.columns:
             df[c] = ""
 
-    df["name"] = df["name"].astype(str).str.strip()
-    p = df["passed_test"].astype(str).str.upper().str.strip()
-    df["passed_test"] = p.isin(["TRUE", "1", "YES", "Y"])
-    df = df[df["name"] != ""].copy()
-    return df
+    df = df.assign(
+        name=df["name"].astype(str).str.strip(),
+        passed_test=df["passed_test"].astype(str).str.upper().str.strip().isin(YES_WORDS),
+    )
+    return df[df["name"] != ""]
 
 
 def get_staff_pins_and_lists():
-    staff_df = load_staff_df_cached()
-    drivers_df = load_drivers_df_cached()
+    """Code map, sorted staff names, and sorted driver names."""
+    return staff_pins_and_lists(load_staff_df_cached(), load_drivers_df_cached())
+
 
-    active_staff_df = staff_df[staff_df["active"]].copy()
-    staff_pins = dict(zip(active_staff_df["name"], active_staff_df["pin"]))
-    staff_names = sorted(list(staff_pins.keys()))
+@st.cache_data(max_entries=4, show_spinner=False)
+def staff_pins_and_lists(staff_df: pd.DataFrame, drivers_df: pd.DataFrame):
+    """The work behind get_staff_pins_and_lists.
+
+    Runs on every rerun of every page, and Streamlit reruns the whole script
+    on each tap. Cached on the roster frames themselves rather than on a timer
+    of its own, so the filtering, zipping and sorting happen once per roster
+    refresh, and a new person or code works as soon as the roster has it.
+    """
+    # Only the name and pin columns of the active rows are taken, rather than
+    # a filtered copy of the whole roster. A repeated name keeps its last
+    # code, as before. Staff without a code (a roster from the disk copy)
+    # still appear in the name lists.
+    active = staff_df.loc[staff_df["active"], ["name", "pin"]]
+    staff_names = sorted(set(active["name"]))
+    active = active[active["pin"] != ""]
+    staff_pins = active.set_index("name")["pin"].to_dict()
 
     eligible_driver_names = set(
         drivers_df.loc[drivers_df["passed_test"], "name"].tolist()
@@ -1257,13 +1688,38 @@ def get_staff_pins_and_lists():
     return staff_pins, staff_names, driver_names
 
 
+@st.cache_resource(show_spinner=False)
+def get_pin_hash_key() -> bytes:
+    """Key for hashing codes. Set pin_hash_key in secrets to keep it stable.
+
+    Without the secret a random key is made once per process. That is fine
+    because the hashes only live in memory and are rebuilt from the sheet.
+    """
+    key = str(st.secrets.get("pin_hash_key", "")).encode()
+    return hashlib.blake2b(key or secrets.token_bytes(32), digest_size=32).digest()
+
+
+def pin_digest(pin: str) -> bytes:
+    """Keyed hash of an already normalized code."""
+    return hashlib.blake2b(str(pin).encode(), key=get_pin_hash_key(), digest_size=16).digest()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
 def build_pin_lookup(staff_pins: dict) -> dict:
-    """Map each code to the staff who use it. A list catches shared codes."""
-    lookup = {}
-    for name, pin in staff_pins.items():
-        p = normalize_pin(pin)
-        lookup.setdefault(p, []).append(name)
-    return lookup
+    """Map each hashed code to the staff who use it. A list catches shared codes.
+
+    Every page with a code box builds this, so it is normalized and grouped
+    in one vectorized pass and cached on the code map itself. Keys are keyed
+    hashes rather than the codes, so a typed code is only ever matched as a
+    digest. This lookup itself holds no plain codes; the roster frames and
+    the code map it is built from still do.
+    """
+    if not staff_pins:
+        return {}
+    names = pd.Series(list(staff_pins.keys()), dtype=object)
+    pins = normalize_pin_series(pd.Series(list(staff_pins.values()), dtype=object))
+    digests = [pin_digest(p) for p in pins.to_numpy().tolist()]
+    return names.groupby(digests, sort=False).agg(list).to_dict()
 
 
 def resolve_code(code: str, pin_lookup: dict):
@@ -1275,7 +1731,7 @@ def resolve_code(code: str, pin_lookup: dict):
     p = normalize_pin(code)
     if not str(code).strip():
         return None, "Enter your code."
-    names = pin_lookup.get(p, [])
+    names = pin_lookup.get(pin_digest(p), [])
     if len(names) == 1:
         return names[0], None
     if len(names) == 0:
@@ -1283,11 +1739,11 @@ def resolve_code(code: str, pin_lookup: dict):
     return None, "This code is shared by more than one person. Ask the office for a unique code."
 
 
-def get_admin_names() -> set:
+def get_admin_names() -> frozenset:
     """Names of active staff flagged admin=TRUE in the staff sheet."""
     staff_df = load_staff_df_cached()
     active_admins = staff_df[(staff_df["active"]) & (staff_df["admin"])]
-    return set(active_admins["name"].tolist())
+    return frozenset(active_admins["name"].to_numpy().tolist())
 
 
 def resolve_admin_code(code: str, staff_pins: dict):
@@ -1317,9 +1773,7 @@ def ensure_logs_header(sheet):
             return
         missing = [h for h in LOGS_HEADERS_REQUIRED if h not in headers]
         if missing:
-            new_headers = headers + missing
-            sheet.delete_rows(1)
-            sheet.insert_row(new_headers, 1)
+            rewrite_header_row(sheet, headers, headers + missing)
     except Exception:
         # Best effort only. The reader already tolerates messy headers and the
         # loaders fill missing columns in memory, so a failure here must never
@@ -1328,33 +1782,83 @@ def ensure_logs_header(sheet):
         pass
 
 
-@st.cache_data(ttl=10)
-def load_logs_df_cached():
-    try:
-        sheet = get_worksheet(SHEET_LOGS)
-        df = read_sheet_df(sheet)
-    except Exception:
-        return pd.DataFrame(columns=LOGS_HEADERS_REQUIRED)
+@st.cache_data(ttl=SHEET_REVISION_MAX_AGE_SECONDS, max_entries=4, show_spinner=False)
+def load_logs_df_at(revision: str):
+    """The logs tab as of one sheet revision. Raises if the read fails, so a
+    failure is never cached under a revision key."""
+    saved = last_good_at(SHEET_LOGS, revision)
+    if saved is not None:
+        return saved
+    df = prepare_logs_df(core_frame_at(revision, SHEET_LOGS))
+    return remember_good_read(SHEET_LOGS, df, revision)
+
 
+def prepare_logs_df(df: pd.DataFrame) -> pd.DataFrame:
+    """Fill missing columns and parse a raw logs read in place, and return it."""
     for c in LOGS_HEADERS_REQUIRED:
         if c not in df.columns:
             df[c] = ""
 
-    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-    df["name"] = df["name"].astype(str).str.strip()
-    df["status"] = df["status"].astype(str).str.strip().str.upper()
-    df["action"] = df["action"].astype(str).str.strip().str.upper()
-    df["reason"] = df["reason"].astype(str).str.strip()
+    # Every row is written with isoformat(), so parse as ISO 8601 directly
+    # rather than letting pandas guess a format from the first row (which
+    # coerces any row written with a space separator to NaT).
+    df["timestamp"] = parse_timestamps(df["timestamp"])
     df["other_reason"] = df["other_reason"].astype(str)
 
+    # These columns repeat a handful of values (IN/OUT, a few reasons, the
+    # staff roster) across every row. As categories they are stored as small
+    # integer codes, so the frame is far smaller to cache and copy, and the
+    # status == "OUT" filters compare codes instead of strings.
+    for c in LOGS_CATEGORY_COLUMNS:
+        df[c] = clean_category(df[c], upper=c in ("action", "status"))
     return df
 
 
+def last_good_logs_df() -> pd.DataFrame:
+    """The last good logs read, or an empty frame. Never touches the network."""
+    last = get_last_good_reads().get(SHEET_LOGS)
+    return last.copy() if last is not None else pd.DataFrame(columns=LOGS_HEADERS_REQUIRED)
+
+
+def load_logs_df_cached():
+    try:
+        return load_logs_df_at(sheet_cache_key())
+    except Exception:
+        return last_good_logs_df()
+
+
+@st.cache_data(ttl=SHEET_REVISION_MAX_AGE_SECONDS, max_entries=4, show_spinner=False)
+def load_latest_logs_at(revision: str):
+    """Each person's latest log row as of one sheet revision.
+
+    The logs only grow, but who is out depends on one row per person. Kept
+    per revision, the board, the sign page strip and the status checks work
+    on a roster-sized frame instead of re-sorting all history every rerun.
+    Taking the latest rows again after merging recent writes gives the same
+    answer as doing it over the full history.
+    """
+    return latest_rows(load_logs_df_at(revision), "name")
+
+
+def load_latest_logs_cached():
+    try:
+        return load_latest_logs_at(sheet_cache_key())
+    except Exception:
+        # Straight to the saved copy: retrying the read that just failed
+        # would only wait out the same stall again.
+        df = last_good_logs_df()
+        return latest_rows(df, "name") if not df.empty else df
+
+
 def clear_logs_cache():
-    load_logs_df_cached.clear()
+    forget_good_revision(SHEET_LOGS)
+    get_sheet_revision.clear()
+    load_core_frames_at.clear()
+    load_logs_df_at.clear()
+    load_latest_logs_at.clear()
 
 
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=600, show_spinner=False)
 def get_log_headers():
     """Cached logs header order. Read once, reused for every write in the
     session, so appends do not re-read the header each time."""
@@ -1365,7 +1869,7 @@ def get_log_headers():
         return list(LOGS_HEADERS_REQUIRED)
 
 
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=600, show_spinner=False)
 def get_van_headers():
     """Cached vans header order, same idea as the logs headers."""
     try:
@@ -1447,31 +1951,15 @@ def append_log_row(name: str, reason: str, other_reason: str, action: str, statu
     try:
         sheet = get_worksheet(SHEET_LOGS)
 
-        row_dict = {
-            "id": str(uuid.uuid4())[:8],
-            "timestamp": datetime.now(TZ).isoformat(timespec="seconds"),
-            "name": name,
-            "reason": reason,
-            "other_reason": other_reason or "",
-            "action": action,
-            "status": status,
-            "due_back": due_back.isoformat(timespec="seconds") if due_back else "",
-            "late": late or "",
-        }
+        row_dict = log_row_dict(name, reason, other_reason, action, status, due_back=due_back, late=late)
         headers = get_log_headers()
         row = [row_dict.get(h, "") for h in headers]
-        sheet.append_row(row)
+        append_sheet_rows(sheet, [row])
         clear_logs_cache()
         remember_status(name, status, reason, other_reason)
 
-        # Phone push after a clean write. Sign-out shows the reason; the typed
-        # detail wins when the reason is Other.
         if notify:
-            if action == "OUT":
-                detail = other_reason.strip() if (reason.startswith("Other") and other_reason.strip()) else reason
-                notify_phone("Bauercrest: Signed OUT", f"{name}: {detail}")
-            else:
-                notify_phone("Bauercrest: Signed IN", name)
+            notify_log_row(name, reason, other_reason, action)
 
         # Handed back so the caller can offer an Undo on this exact row.
         return row_dict["id"]
@@ -1480,6 +1968,32 @@ def append_log_row(name: str, reason: str, other_reason: str, action: str, statu
         st.stop()
 
 
+def log_row_dict(name: str, reason: str, other_reason: str, action: str, status: str,
+                 due_back=None, late: str = "") -> dict:
+    """One logs row, keyed by header, stamped now with a fresh id."""
+    return {
+        "id": str(uuid.uuid4())[:8],
+        "timestamp": datetime.now(TZ).isoformat(timespec="seconds"),
+        "name": name,
+        "reason": reason,
+        "other_reason": other_reason or "",
+        "action": action,
+        "status": status,
+        "due_back": due_back.isoformat(timespec="seconds") if due_back else "",
+        "late": late or "",
+    }
+
+
+def notify_log_row(name: str, reason: str, other_reason: str, action: str):
+    """Phone push after a clean write. Sign-out shows the reason; the typed
+    detail wins when the reason is Other."""
+    if action == "OUT":
+        detail = other_reason.strip() if (reason.startswith("Other") and other_reason.strip()) else reason
+        notify_phone("Bauercrest: Signed OUT", f"{name}: {detail}")
+    else:
+        notify_phone("Bauercrest: Signed IN", name)
+
+
 # =================================================
 # UNDO
 # =================================================
@@ -1494,6 +2008,55 @@ UNDO_WINDOW_SECONDS = 120
 VAN_SELECT_TIMEOUT_SECONDS = 90
 
 
+def find_rows_by_id(sheet, id_col: int, ids) -> list:
+    """Sheet row numbers (1-based, header excluded) whose id is in ids.
+
+    Reads ONLY the id column. gspread's find() downloads the whole tab to
+    search it, so on a long log every lookup paid for every column of every
+    row just to match one short id.
+    """
+    wanted = {str(i).strip() for i in ids if str(i).strip()}
+    if not wanted:
+        return []
+    col = pd.Series(sheet.col_values(id_col)[1:], dtype=object).astype(str).str.strip()
+    return (np.flatnonzero(col.isin(wanted).to_numpy()) + 2).tolist()
+
+
+def delete_sheet_rows(sheet, row_numbers):
+    """Delete the given 1-based rows, touching nothing else on the tab.
+
+    Adjacent rows are grouped into one range, and ranges are removed from the
+    bottom up so the row numbers still to be deleted never shift. All ranges
+    go in one batchUpdate, which Sheets applies in order and all-or-nothing,
+    so a scattered delete is one round-trip instead of one per range.
+    """
+    rows = sorted(set(row_numbers))
+    if not rows:
+        return
+    blocks = []
+    start = prev = rows[0]
+    for r in rows[1:]:
+        if r != prev + 1:
+            blocks.append((start, prev))
+            start = r
+        prev = r
+    blocks.append((start, prev))
+    requests_body = [
+        {
+            "deleteDimension": {
+                "range": {
+                    "sheetId": sheet.id,
+                    "dimension": "ROWS",
+                    "startIndex": start - 1,
+                    "endIndex": end,
+                }
+            }
+        }
+        for start, end in reversed(blocks)
+    ]
+    sheet.spreadsheet.batch_update({"requests": requests_body})
+
+
 def delete_log_row_by_id(row_id: str) -> bool:
     """Delete one log row by its id. True if it was removed.
 
@@ -1512,17 +2075,11 @@ def delete_log_row_by_id(row_id: str) -> bool:
         # Search the id COLUMN only. A whole-sheet search could land on the
         # same string sitting in another column (a typed reason, a note) and
         # then either delete the wrong row or refuse and quietly do nothing.
-        try:
-            cell = sheet.find(row_id, in_column=id_col)
-        except TypeError:
-            cell = sheet.find(row_id)
-            if cell and cell.col != id_col:
-                cell = None
-
-        if not cell or cell.col != id_col:
+        rows = find_rows_by_id(sheet, id_col, [row_id])
+        if not rows:
             return False
 
-        sheet.delete_rows(cell.row)
+        sheet.delete_rows(rows[0])
         clear_logs_cache()
         return True
     except Exception:
@@ -1575,36 +2132,20 @@ def clear_all_logs():
 
 
 def delete_logs_by_ids(ids_to_delete):
-    try:
-        sheet = get_worksheet(SHEET_LOGS)
-        df = load_logs_df_cached()
-    except (APIError, GSpreadException):
-        st.error("Could not update logs in Google Sheets. Please try again later.")
-        st.stop()
-
-    if df.empty:
-        return
-
-    df_keep = df[~df["id"].isin(ids_to_delete)].copy()
+    """Delete the selected log rows in place.
 
+    Only the matching rows are removed. The old approach cleared the whole tab
+    and re-appended every surviving row, two writes the size of the full log
+    for a handful of deletions, and it rewrote every kept timestamp in
+    pandas' format instead of the text originally written.
+    """
     try:
-        # Rewrite using the sheet's ACTUAL header order, not a hardcoded list.
-        # Forcing a fixed column list would drop any extra column and could
-        # shift data into the wrong columns.
+        sheet = get_worksheet(SHEET_LOGS)
         headers = get_log_headers()
-        sheet.clear()
-        sheet.insert_row(headers, 1)
-        if not df_keep.empty:
-            df_out = df_keep.copy()
-            df_out["timestamp"] = df_out["timestamp"].astype(str)
-            for h in headers:
-                if h not in df_out.columns:
-                    df_out[h] = ""
-            rows = df_out[headers].astype(str).values.tolist()
-            if rows:
-                sheet.append_rows(rows)
+        id_col = (headers.index("id") + 1) if "id" in headers else 1
+        rows = find_rows_by_id(sheet, id_col, ids_to_delete)
+        delete_sheet_rows(sheet, rows)
         clear_logs_cache()
-        get_log_headers.clear()
     except (APIError, GSpreadException):
         st.error("Could not finish deleting selected log entries. Please try again later.")
         st.stop()
@@ -1624,18 +2165,48 @@ def _sorted_by_recency(df: pd.DataFrame) -> pd.DataFrame:
        With na_position="last" a NaT row would sort NEWEST and win, freezing a
        person's status. We push bad rows to the FRONT so they can never win.
     3. A stable sort keeps equal keys in their original order.
+
+    A log already in time order (the usual case, since rows are appended as
+    they happen) comes back as is, without the sort.
     """
-    tmp = df.copy().reset_index(drop=True)
+    tmp = df.reset_index(drop=True)
     tmp["_row"] = range(len(tmp))
     tmp["timestamp"] = pd.to_datetime(tmp["timestamp"], errors="coerce", format="mixed")
-    tmp = tmp.sort_values(
-        ["timestamp", "_row"],
-        na_position="first",
-        kind="stable",
-    )
+    if tmp["timestamp"].hasnans or not tmp["timestamp"].is_monotonic_increasing:
+        tmp = tmp.sort_values(
+            ["timestamp", "_row"],
+            na_position="first",
+            kind="stable",
+        )
     return tmp
 
 
+def latest_rows(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    """The most recent row for each distinct value of key, oldest first.
+
+    drop_duplicates(keep="last") on the recency-sorted frame is one hashed
+    pass. groupby().tail(1) built a full group map just to throw all but one
+    row of each group away. Only the timestamp, row number and key are
+    sorted, the same way _sorted_by_recency sorts; the full frame is never
+    copied, and just the winning rows are taken from it. The result matches
+    _sorted_by_recency(df).drop_duplicates(...) column for column.
+    """
+    ts = pd.to_datetime(df["timestamp"], errors="coerce", format="mixed")
+    order = pd.DataFrame({
+        "timestamp": ts.to_numpy(),
+        "_row": np.arange(len(df)),
+        "_key": df[key].to_numpy(),
+    })
+    # Rows are appended as they happen, so the log is normally in time order
+    # already. Then the stable sort would return it unchanged; skip it and
+    # only pay for the sort when a row is out of order or unparseable.
+    if ts.hasnans or not ts.is_monotonic_increasing:
+        order = order.sort_values(["timestamp", "_row"], na_position="first", kind="stable")
+    pos = order.drop_duplicates(subset=["_key"], keep="last")["_row"].to_numpy()
+    out = df.iloc[pos].set_axis(pos)
+    return out.assign(timestamp=ts.iloc[pos].to_numpy(), _row=pos)
+
+
 def get_currently_out(df: pd.DataFrame) -> pd.DataFrame:
     """Return a dataframe of people whose latest status is OUT.
 
@@ -1647,17 +2218,18 @@ def get_currently_out(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return empty
 
-    tmp = _sorted_by_recency(df)
+    last_actions = latest_rows(df, "name")
     for c in ["due_back", "id"]:
-        if c not in tmp.columns:
-            tmp[c] = ""
-    last_actions = tmp.groupby("name", dropna=False).tail(1)
-    out_rows = last_actions[last_actions["status"] == "OUT"].copy()
+        if c not in last_actions.columns:
+            last_actions[c] = ""
+    # The mask and the column pick each build a new frame already, so no
+    # copy is needed on the way out.
+    out_rows = last_actions.loc[last_actions["status"] == "OUT", cols]
 
     if out_rows.empty:
         return empty
 
-    return out_rows[cols]
+    return out_rows
 
 
 # Marker stored in a van-driven sign-out's other_reason. Lets the van return
@@ -1678,7 +2250,7 @@ def get_logs_archive_sheet():
         sheet = ss.add_worksheet(title=SHEET_LOGS_ARCHIVE, rows=200, cols=len(LOGS_HEADERS_REQUIRED))
         sheet.update("A1", [list(LOGS_HEADERS_REQUIRED)])
         try:
-            get_worksheet.clear()
+            get_worksheet_map.clear()
         except Exception:
             pass
         return sheet
@@ -1712,8 +2284,9 @@ def plan_archive(live_df: pd.DataFrame, raw_rows: list, header: list, now=None):
     now = now or datetime.now(TZ)
     cutoff = now - timedelta(days=ARCHIVE_KEEP_DAYS)
 
-    # Names whose latest row is OUT, judged on the real sheet data.
-    out_names = set(get_currently_out(live_df)["name"].astype(str).str.strip().tolist())
+    # Names whose latest row is OUT, judged on the real sheet data. Built once
+    # as a frozenset so the per-row check below is a hash lookup.
+    out_names = frozenset(get_currently_out(live_df)["name"].astype(str).str.strip().to_numpy().tolist())
 
     try:
         name_i = header.index("name")
@@ -1751,11 +2324,15 @@ def archive_old_logs():
          archive grew by exactly the number of rows we sent. If it did not,
          ABORT and leave the live tab completely untouched. Nothing is ever
          removed from live until its copy is confirmed present in the archive.
-      4. Rewrite the live tab by overwriting from the top with the kept rows,
-         then trimming the now-redundant tail. This never leaves the live tab
-         empty: if the trim step fails, the kept rows are already in place and
-         some old rows simply remain (harmless duplicates of the archive), so
-         the board still works. It fails safe, never with data loss.
+      4. Delete just the archived rows from the live tab, in place. Rows can
+         shift while steps 1-3 run (an admin delete, a log clear), so the
+         archived rows are found again by id right before the delete, never
+         by the row numbers from step 1. A row with no id, or whose id is
+         shared with a kept row, is left live. Kept rows are never rewritten,
+         so nothing signed in or out while this ran can be overwritten. If a
+         delete fails or a row cannot be found, old rows simply remain
+         (harmless duplicates of the archive), so the board still works. It
+         fails safe, never with data loss.
     """
     result = {"ok": False, "archived": 0, "kept": 0, "message": ""}
     try:
@@ -1775,7 +2352,7 @@ def archive_old_logs():
         result["message"] = "No log rows yet. Nothing to archive."
         return result
 
-    live_df = read_sheet_df(live)
+    live_df = frame_from_values(all_vals)
     keep_rows, archive_rows = plan_archive(live_df, raw_rows, header)
     result["kept"] = len(keep_rows)
 
@@ -1789,7 +2366,7 @@ def archive_old_logs():
         arch = get_logs_archive_sheet()
         before = len(arch.get_all_values())
         for i in range(0, len(archive_rows), 500):
-            arch.append_rows(archive_rows[i:i + 500])
+            append_sheet_rows(arch, archive_rows[i:i + 500])
         after = len(arch.get_all_values())
     except Exception:
         result["message"] = "Could not write to the archive tab. Live logs were left untouched, nothing was lost."
@@ -1804,18 +2381,13 @@ def archive_old_logs():
         return result
 
     # --- Step 4: shrink the live tab, failing safe ---
+    id_i = header.index("id") if "id" in header else 0
+    keep_ids = {str(r[id_i]).strip() for r in keep_rows}
+    moved_ids = {str(r[id_i]).strip() for r in archive_rows} - keep_ids
     try:
-        new_live = [header] + keep_rows
-        live.update("A1", new_live)
-        old_total = len(all_vals)
-        new_total = len(new_live)
-        if old_total > new_total:
-            live.delete_rows(new_total + 1, old_total)
+        rows_now = find_rows_by_id(live, id_i + 1, moved_ids)
+        delete_sheet_rows(live, rows_now)
         clear_logs_cache()
-        try:
-            get_log_headers.clear()
-        except Exception:
-            pass
     except Exception:
         result["message"] = (
             f"Archived {len(archive_rows)} rows to logs_archive, but shrinking the "
@@ -1832,6 +2404,12 @@ def archive_old_logs():
         f"holds {len(keep_rows)} rows (everyone still out, plus the last "
         f"{ARCHIVE_KEEP_DAYS} days). Nothing was deleted, only moved."
     )
+    left = len(archive_rows) - len(rows_now)
+    if left > 0:
+        result["message"] += (
+            f" {left} archived rows could not be matched by a unique id, so any "
+            "still there were left in the live tab too."
+        )
     return result
 
 
@@ -1925,18 +2503,20 @@ def merge_recent_writes(df: pd.DataFrame) -> pd.DataFrame:
     if not rows:
         return df
     add = pd.DataFrame(rows)
+    # Parse the local timestamps the same way the loader parses the sheet's,
+    # so the merged column stays datetime64. Left as text, the concat would
+    # upcast the whole column to object and every reader after this would
+    # have to re-parse all of it.
+    add["timestamp"] = parse_timestamps(add["timestamp"])
     if df is None or df.empty:
         return add
-    # Work on copies. df here is the process-wide cached logs frame, so adding
-    # columns to it in place would poison the cache for every other reader.
-    base = df.copy()
-    for c in base.columns:
-        if c not in add.columns:
-            add[c] = ""
-    for c in add.columns:
-        if c not in base.columns:
-            base[c] = ""
-    return pd.concat([base, add[base.columns]], ignore_index=True)
+    # Never add columns to df in place: it is the process-wide cached logs
+    # frame, and mutating it would poison the cache for every other reader.
+    # concat already builds a new frame, so no up-front full copy is needed;
+    # assign only copies in the rare case the local rows carry a new column.
+    missing = [c for c in add.columns if c not in df.columns]
+    base = df.assign(**{c: "" for c in missing}) if missing else df
+    return pd.concat([base, add.reindex(columns=base.columns, fill_value="")], ignore_index=True)
 
 
 def get_latest_status_map(df: pd.DataFrame) -> dict:
@@ -1947,21 +2527,34 @@ def get_latest_status_map(df: pd.DataFrame) -> dict:
     """
     if df is None or df.empty:
         return {}
-    tmp = _sorted_by_recency(df)
-    last = tmp.groupby("name", dropna=False).tail(1)
+    last = latest_rows(df, "name")
+    fields = ["status", "reason", "other_reason", "due_back", "id", "timestamp"]
+    # Clean whole columns at once, then zip plain lists. No per-row Series.
+    cols = {}
+    for c in ["name"] + fields:
+        if c in last.columns:
+            cols[c] = last[c].astype(str).str.strip()
+        else:
+            cols[c] = pd.Series("", index=last.index)
+    cols["status"] = cols["status"].str.upper()
     out = {}
-    for _, r in last.iterrows():
-        out[str(r.get("name", "")).strip()] = {
-            "status": str(r.get("status", "")).strip().upper(),
-            "reason": str(r.get("reason", "")).strip(),
-            "other_reason": str(r.get("other_reason", "")).strip(),
-            "due_back": str(r.get("due_back", "")).strip(),
-            "id": str(r.get("id", "")).strip(),
-            "timestamp": str(r.get("timestamp", "")).strip(),
-        }
+    for name, *vals in zip(*(cols[c].tolist() for c in ["name"] + fields)):
+        out[name] = dict(zip(fields, vals))
     return out
 
 
+def read_latest_logs_fresh() -> pd.DataFrame:
+    """Each person's latest log row from a direct read of just the logs tab.
+
+    Bypasses every cache and the revision check, and has no last-good
+    fallback: a failed read raises. The cached loaders are left alone, so
+    a status check costs one read instead of a cache flush and a reload of
+    every tab.
+    """
+    df = prepare_logs_df(read_sheet_df(get_worksheet(SHEET_LOGS)))
+    return latest_rows(df, "name") if not df.empty else df
+
+
 def get_status_fresh(name: str):
     """Read this person's TRUE current status straight from the sheet.
 
@@ -1971,14 +2564,11 @@ def get_status_fresh(name: str):
     sign someone OUT a second time when they meant to sign IN, leaving them
     stuck on the Who's Out board.
 
-    So before deciding direction, we drop the cache and re-read. Returns a
-    dict with status/reason/other_reason, or None if the person has no rows.
+    So before deciding direction, we re-read. Returns a dict with
+    status/reason/other_reason, or None if the person has no rows. Raises if
+    the read fails, rather than deciding from a saved copy.
     """
-    try:
-        clear_logs_cache()
-    except Exception:
-        pass
-    df = merge_recent_writes(load_logs_df_cached())
+    df = merge_recent_writes(read_latest_logs_fresh())
     return get_latest_status_map(df).get((name or "").strip())
 
 
@@ -1989,13 +2579,9 @@ def get_status_map_fresh() -> dict:
     who is currently IN. Deciding that from a cache up to 10 seconds old can
     sign out someone who ALREADY signed themselves out seconds earlier, giving
     them two OUT rows and stranding them on the board. Same failure mode that
-    hit the toggle. So these reads are always fresh.
+    hit the toggle. So these reads are always fresh, and raise if they fail.
     """
-    try:
-        clear_logs_cache()
-    except Exception:
-        pass
-    return get_latest_status_map(merge_recent_writes(load_logs_df_cached()))
+    return get_latest_status_map(merge_recent_writes(read_latest_logs_fresh()))
 
 
 def append_log_rows_batch(rows: list) -> bool:
@@ -2011,7 +2597,7 @@ def append_log_rows_batch(rows: list) -> bool:
         sheet = get_worksheet(SHEET_LOGS)
         headers = get_log_headers()
         matrix = [[rd.get(h, "") for h in headers] for rd in rows]
-        sheet.append_rows(matrix)
+        append_sheet_rows(sheet, matrix)
         clear_logs_cache()
         for rd in rows:
             remember_status(rd.get("name", ""), rd.get("status", ""), rd.get("reason", ""), rd.get("other_reason", ""))
@@ -2052,51 +2638,15 @@ def auto_signout_for_van(party: list, van_name: str):
     return signed if ok else []
 
 
-def auto_signin_for_van(party: list):
-    """Sign back in only the people whose latest row is a van sign-out.
-
-    Someone who signed themselves in already, or who was out for their own
-    reason, is skipped. No doubles, no overriding. One batched call, never
-    halts the van flow. Returns the list of names signed in.
-    """
-    status_map = get_status_map_fresh()
-    rows = []
-    signed = []
-    for name in party:
-        name = (name or "").strip()
-        if not name:
-            continue
-        info = status_map.get(name)
-        if not info:
-            continue
-        is_van_out = (
-            info["status"] == "OUT"
-            and info["reason"] == "Van"
-            and info["other_reason"].startswith(VAN_SIGNOUT_TAG)
-        )
-        if is_van_out:
-            rows.append({
-                "id": str(uuid.uuid4())[:8],
-                "timestamp": datetime.now(TZ).isoformat(timespec="seconds"),
-                "name": name,
-                "reason": "Van",
-                "other_reason": info["other_reason"],
-                "action": "IN",
-                "status": "IN",
-            })
-            signed.append(name)
-    ok = append_log_rows_batch(rows)
-    return signed if ok else []
-
-
-def signin_everyone_on_van(van_name: str):
+def signin_everyone_on_van(van_name: str, returner: str = ""):
     """Sign back in EVERYONE still stuck out under this van's tag.
 
     This is what runs when a van is returned. Instead of trusting a stored
     driver name from a possibly-stale frame, it reads the live state and clears
     anyone whose current status is a Van sign-out for THIS van. That means a
     returned van always frees whoever it stranded, no matter who drove it back,
-    so you stop having to admin-fix people. Returns the names signed in.
+    so you stop having to admin-fix people. The returner, if out on any van,
+    is back at camp too and goes in the same write. Returns the names signed in.
     """
     tag = f"{VAN_SIGNOUT_TAG}|{van_name}"
     status_map = get_status_map_fresh()
@@ -2109,7 +2659,7 @@ def signin_everyone_on_van(van_name: str):
         if (
             info["status"] == "OUT"
             and info["reason"] == "Van"
-            and info["other_reason"].strip() == tag
+            and (info["other_reason"].strip() == tag or name == returner)
         ):
             rows.append({
                 "id": str(uuid.uuid4())[:8],
@@ -2133,29 +2683,38 @@ ADMIN_SIGNIN_TAG = "ADMIN_SIGNIN"
 # =================================================
 # DAYS OFF (DISPLAY ONLY)
 # =================================================
-@st.cache_data(ttl=15)
-def load_days_off_df_cached():
-    """Reads days_off sheet if present. If missing, returns empty DF (feature disabled)."""
+@st.cache_data(ttl=SHEET_REVISION_MAX_AGE_SECONDS, max_entries=4, show_spinner=False)
+def load_days_off_df_at(revision: str):
+    """The days_off tab as of one sheet revision. A missing tab is cached as
+    empty (feature disabled); adding the tab changes the revision anyway."""
     try:
         sheet = get_worksheet(SHEET_DAYS_OFF)
-        df = read_sheet_df(sheet)
-    except Exception:
+    except WorksheetNotFound:
         return pd.DataFrame(columns=["name", "weekday", "active"])
+    df = read_sheet_df(sheet)
 
     for c in ["name", "weekday", "active"]:
         if c not in df.columns:
             df[c] = ""
 
     df["name"] = df["name"].astype(str).str.strip()
-    df["weekday"] = df["weekday"].astype(str).apply(normalize_weekday)
+    df["weekday"] = normalize_weekday_series(df["weekday"])
 
     a = df["active"].astype(str).str.upper().str.strip()
-    df["active"] = a.isin(["TRUE", "1", "YES", "Y", ""])
+    df["active"] = a.isin(YES_WORDS | {""})
 
     df = df[df["name"] != ""].copy()
     return df
 
 
+def load_days_off_df_cached():
+    """Reads days_off sheet if present. If missing, returns empty DF (feature disabled)."""
+    try:
+        return load_days_off_df_at(sheet_cache_key())
+    except Exception:
+        return pd.DataFrame(columns=["name", "weekday", "active"])
+
+
 def get_day_off_names_today() -> list:
     """Names scheduled for a day off today, from the days_off sheet.
 
@@ -2212,81 +2771,127 @@ def ensure_vans_header(sheet):
                     extras.append(str(h).strip())
                     seen.add(hl)
             clean = VANS_HEADERS_REQUIRED + extras
-            sheet.delete_rows(1)
-            sheet.insert_row(clean, 1)
+            rewrite_header_row(sheet, headers, clean)
         elif missing:
             new_headers = [str(h).strip() for h in headers] + missing
-            sheet.delete_rows(1)
-            sheet.insert_row(new_headers, 1)
+            rewrite_header_row(sheet, headers, new_headers)
     except Exception:
         # Best effort, same as the logs header. Never halt on this.
         pass
 
 
-@st.cache_data(ttl=10)
+@st.cache_data(ttl=SHEET_REVISION_MAX_AGE_SECONDS, max_entries=4, show_spinner=False)
+def load_vans_df_at(revision: str):
+    saved = last_good_at(SHEET_VANS, revision)
+    if saved is not None:
+        return saved
+    df = core_frame_at(revision, SHEET_VANS)
+    # Parsed once here, the same way as the logs, so no reader downstream
+    # has to run its own to_datetime pass over the column.
+    if "timestamp" in df.columns:
+        df["timestamp"] = parse_timestamps(df["timestamp"])
+    # Three vans, two statuses, two actions, a handful of drivers, purposes and
+    # gas levels: same category trick as the logs.
+    for c in VANS_CATEGORY_COLUMNS:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    return remember_good_read(SHEET_VANS, df, revision)
+
+
 def load_vans_df_cached():
-    sheet = get_vans_sheet()
-    return read_sheet_df(sheet)
+    try:
+        return load_vans_df_at(sheet_cache_key())
+    except Exception:
+        last = get_last_good_reads().get(SHEET_VANS)
+        if last is None:
+            raise
+        return last.copy()
 
 
 def clear_vans_cache():
-    load_vans_df_cached.clear()
+    forget_good_revision(SHEET_VANS)
+    get_sheet_revision.clear()
+    load_core_frames_at.clear()
+    load_vans_df_at.clear()
 
 
 def append_vans_row(row_dict: dict):
     sheet = get_vans_sheet()
     headers = get_van_headers()
     row = [row_dict.get(h, "") for h in headers]
-    sheet.append_row(row)
+    append_sheet_rows(sheet, [row])
     clear_vans_cache()
 
 
+@st.cache_data(ttl=SHEET_REVISION_MAX_AGE_SECONDS, max_entries=4, show_spinner=False)
 def compute_van_status(vans_df: pd.DataFrame) -> dict:
+    """Current state of each van from the van log.
+
+    Cached on the log's contents, so the van page's many reruns (a van
+    picked, a gas level chosen) and the admin page reuse the map until a van
+    is actually taken or returned.
+    """
     status_map = {v: {"status": "IN"} for v in VANS}
     if vans_df is None or vans_df.empty:
         return status_map
 
-    tmp = vans_df.copy()
-    for col in ["timestamp", "van", "status", "driver", "purpose", "passengers", "other_purpose", "action", "gas_left"]:
-        if col not in tmp.columns:
-            tmp[col] = ""
+    # Missing columns are added on a new frame (assign), and only when there
+    # are any; the cached van log itself is never touched, so no up-front copy.
+    missing = {
+        col: ""
+        for col in ["timestamp", "van", "status", "driver", "purpose", "passengers", "other_purpose", "action", "gas_left"]
+        if col not in vans_df.columns
+    }
+    tmp = vans_df.assign(**missing) if missing else vans_df
 
     # Same robust ordering used for people. Without this a single unreadable
     # timestamp sorted NEWEST and won, freezing a van as OUT forever, and a
     # checkout and checkin written in the same second were a coin flip.
     tmp = _sorted_by_recency(tmp)
 
+    # Latest row per van as a plain dict, built once, so the loop below is a
+    # dict lookup per van instead of a boolean mask and a Series per van. The
+    # status is normalized on the whole column at once: anything other than
+    # IN or OUT counts as IN.
+    latest = tmp.drop_duplicates(subset=["van"], keep="last")
+    status_up = latest["status"].astype(str).str.strip().str.upper().to_numpy()
+    latest = latest.assign(status=np.where(np.isin(status_up, ["IN", "OUT"]), status_up, "IN"))
+    last_by_van = latest.set_index("van").to_dict(orient="index")
+    # Gas is only recorded on a sign-in, so keep the most recent row that
+    # actually has a gas value, regardless of whether the van is out now.
+    # Rows are oldest first, so later values overwrite earlier ones.
+    gas_col = tmp["gas_left"].astype(str).str.strip()
+    has_gas = gas_col != ""
+    gas_by_van = dict(zip(tmp.loc[has_gas, "van"], gas_col[has_gas]))
+    # The latest checkout per van, from the same sorted frame. The van page
+    # banner and both sign-in paths read who took the van and its purpose
+    # from here instead of re-sorting the van log themselves.
+    is_out_row = tmp["status"].astype(str).str.upper() == "OUT"
+    out_by_van = tmp[is_out_row].drop_duplicates(subset=["van"], keep="last").set_index("van").to_dict(orient="index")
+
     for v in VANS:
-        rows = tmp[tmp["van"] == v]
-        if rows.empty:
+        last = last_by_van.get(v)
+        if last is None:
             continue
-        last = rows.iloc[-1]
-        st_val = str(last.get("status", "")).strip().upper()
-        if st_val not in ("IN", "OUT"):
-            st_val = "IN"
-        # Gas is only recorded on a sign-in, so read the most recent row that
-        # actually has a gas value, regardless of whether the van is out now.
-        gas = ""
-        gas_rows = rows[rows["gas_left"].astype(str).str.strip() != ""]
-        if not gas_rows.empty:
-            gas = str(gas_rows.iloc[-1].get("gas_left", "")).strip()
+        gas = gas_by_van.get(v, "")
+        src = out_by_van.get(v, last)
         status_map[v] = {
-            "status": st_val,
+            "status": str(last["status"]),
             "driver": str(last.get("driver", "")).strip(),
             "purpose": str(last.get("purpose", "")).strip(),
             "other_purpose": str(last.get("other_purpose", "")).strip(),
             "passengers": str(last.get("passengers", "")).strip(),
             "gas": gas,
+            "checkout": {
+                "driver": str(src.get("driver", "")).strip(),
+                "timestamp": src.get("timestamp"),
+                "purpose": str(src.get("purpose", "")).strip(),
+                "other_purpose": str(src.get("other_purpose", "")).strip(),
+            },
         }
     return status_map
 
 
-def next_available_van(status_map: dict):
-    for v in VANS:
-        if status_map.get(v, {}).get("status") != "OUT":
-            return v
-    return None
-
 # =================================================
 # BOARD RENDERING
 # =================================================
@@ -2298,14 +2903,24 @@ def clean_other_reason(other_reason: str) -> str:
     return s
 
 
-def render_out_cards(df_out: pd.DataFrame, forgot_zone: bool = False):
+@st.cache_data(ttl=BOARD_REFRESH_SECONDS, max_entries=8, show_spinner=False)
+def out_cards_html(df_out: pd.DataFrame, forgot_zone: bool = False) -> str:
+    """The board's card grid as one HTML string.
+
+    Keyed on the out rows themselves, mins_late included, so a rerun where
+    nobody signed in or out and no late count ticked reuses the markup
+    instead of formatting every card again. The ttl lets "today" roll over.
+    """
     cards = []
+    # Plain dicts, not a pandas Series per card. row_minutes_late and the
+    # formatters only need .get, so they take a dict just the same.
     df = df_out.sort_values("timestamp")
-    for _, row in df.iterrows():
+    df = df.assign(when=format_board_time_series(df["timestamp"]))
+    for row in df.to_dict("records"):
         name = esc(row.get("name", ""))
         reason = esc(row.get("reason", ""))
         details = esc(clean_other_reason(row.get("other_reason", "")))
-        when = esc(format_board_time(row.get("timestamp")))
+        when = esc(row["when"])
 
         # Late = past their due-back time and still not signed in. Recomputed
         # from the current reason, so a reason edit in the sheet corrects it.
@@ -2334,7 +2949,11 @@ def render_out_cards(df_out: pd.DataFrame, forgot_zone: bool = False):
             f"<div class='bc-meta'>Signed out at <span class='bc-time'>{when}</span></div>"
             f"</div>"
         )
-    st.markdown(f"<div class='bc-grid'>{''.join(cards)}</div>", unsafe_allow_html=True)
+    return f"<div class='bc-grid'>{''.join(cards)}</div>"
+
+
+def render_out_cards(df_out: pd.DataFrame, forgot_zone: bool = False):
+    st.markdown(out_cards_html(df_out, forgot_zone), unsafe_allow_html=True)
 
 
 def render_day_off_chips(names: list):
@@ -2342,39 +2961,6 @@ def render_day_off_chips(names: list):
     st.markdown(f"<div class='bc-dayoff-row'>{chips}</div>", unsafe_allow_html=True)
 
 
-def render_van_cards(status_map: dict):
-    cards = []
-    for v in VANS:
-        info = status_map.get(v, {"status": "IN"})
-        out = info.get("status") == "OUT"
-
-        if out:
-            purpose = info.get("purpose", "")
-            if purpose == "Other" and info.get("other_purpose"):
-                purpose = f"Other: {info.get('other_purpose')}"
-            passengers = info.get("passengers", "")
-            passengers_html = (
-                f"<div class='bc-meta'>Passengers: {esc(passengers)}</div>" if passengers else ""
-            )
-            cards.append(
-                f"<div class='bc-van-card bc-van-out'>"
-                f"<div class='bc-van-status out'>OUT</div>"
-                f"<div class='bc-van-title'>{esc(van_label(v))}</div>"
-                f"<div class='bc-meta'>Driver: <strong>{esc(info.get('driver', ''))}</strong></div>"
-                f"<div class='bc-meta'>Purpose: {esc(purpose)}</div>"
-                f"{passengers_html}"
-                f"</div>"
-            )
-        else:
-            cards.append(
-                f"<div class='bc-van-card'>"
-                f"<div class='bc-van-status in'>IN</div>"
-                f"<div class='bc-van-title'>{esc(van_label(v))}</div>"
-                f"<div class='bc-meta'>Parked at camp</div>"
-                f"</div>"
-            )
-    st.markdown(f"<div class='bc-grid'>{''.join(cards)}</div>", unsafe_allow_html=True)
-
 # =================================================
 # PAGES
 # =================================================
@@ -2434,19 +3020,24 @@ def render_stale_fork(reason: str, other_reason: str):
                 st.session_state["fork_error"] = "Pick a reason above first, then tap Signing OUT."
                 st.rerun()
             # Close the forgotten sign-out quietly, then open a fresh one now, so
-            # the record is honest and they are not left marked in camp.
-            append_log_row(
+            # the record is honest and they are not left marked in camp. Both
+            # rows go in one append, in this order, so the OUT row is the
+            # later one and wins.
+            due = compute_due_back(reason, datetime.now(TZ))
+            closing = log_row_dict(
                 name,
                 fork.get("reason", ""),
                 fork.get("other_reason", ""),
                 action="IN",
                 status="IN",
                 late="AUTO-CLOSED (forgot to sign in)",
-                notify=False,
             )
-            due = compute_due_back(reason, datetime.now(TZ))
-            new_id = append_log_row(name, reason, other_reason, action="OUT", status="OUT", due_back=due)
-            set_pending_undo(new_id, f"{name}'s sign-out")
+            opening = log_row_dict(name, reason, other_reason, action="OUT", status="OUT", due_back=due)
+            if not append_log_rows_batch([closing, opening]):
+                st.error("Could not record this sign-in/sign-out due to a problem talking to Google Sheets.")
+                st.stop()
+            notify_log_row(name, reason, other_reason, "OUT")
+            set_pending_undo(opening["id"], f"{name}'s sign-out")
             st.session_state.pop("pending_fork", None)
             st.session_state["log_flash_kind"] = "out"
             st.session_state["log_flash_word"] = f"{name.upper()} IS SIGNED OUT"
@@ -2465,25 +3056,15 @@ def render_stale_fork(reason: str, other_reason: str):
         st.error(ferr)
 
 
-def whos_out_strip():
-    """A compact live list of who is out, right under the sign box.
+@st.cache_data(ttl=BOARD_REFRESH_SECONDS, max_entries=8, show_spinner=False)
+def whos_out_strip_html(df_out: pd.DataFrame) -> tuple:
+    """(active, forgot) chip rows for the strip; "" for an empty group.
 
-    Reuses the same cached logs read the board uses, with the session's own
-    recent writes merged in, so it never adds a blocking call and never slows
-    the code box. Forgot-zone people are shown separately, like the board.
+    Cached like the board cards, so the sign page's reruns (a reason picked,
+    an Other reason typed) reuse the chips while nobody's status changes.
     """
-    try:
-        df_out = get_currently_out(merge_recent_writes(load_logs_df_cached()))
-    except Exception:
-        return
-
-    st.markdown("<div class='bc-strip-title'>Signed out right now</div>", unsafe_allow_html=True)
-    if df_out is None or df_out.empty:
-        st.markdown("<div class='bc-strip-empty'>Everyone is in camp.</div>", unsafe_allow_html=True)
-        return
-
     forgot, active = [], []
-    for _, r in df_out.iterrows():
+    for r in df_out.to_dict("records"):
         item = {
             "name": str(r.get("name", "")).strip(),
             "reason": str(r.get("reason", "")).strip(),
@@ -2501,14 +3082,36 @@ def whos_out_strip():
         tail = " · NO SIGN-IN" if forgot_zone else (f" · {detail}" if detail else "")
         return f"<span class='{cls}'>{label}{esc(tail)}</span>"
 
-    if active:
-        st.markdown("<div class='bc-strip'>" + "".join(chip(i) for i in active) + "</div>", unsafe_allow_html=True)
-    if forgot:
-        st.markdown(
-            "<div class='bc-strip-forgot-label'>Probably forgot to sign in</div>"
-            "<div class='bc-strip'>" + "".join(chip(i, True) for i in forgot) + "</div>",
-            unsafe_allow_html=True,
-        )
+    active_html = "<div class='bc-strip'>" + "".join(chip(i) for i in active) + "</div>" if active else ""
+    forgot_html = (
+        "<div class='bc-strip-forgot-label'>Probably forgot to sign in</div>"
+        "<div class='bc-strip'>" + "".join(chip(i, True) for i in forgot) + "</div>"
+    ) if forgot else ""
+    return active_html, forgot_html
+
+
+def whos_out_strip():
+    """A compact live list of who is out, right under the sign box.
+
+    Reuses the same cached logs read the board uses, with the session's own
+    recent writes merged in, so it never adds a blocking call and never slows
+    the code box. Forgot-zone people are shown separately, like the board.
+    """
+    try:
+        df_out = with_minutes_late(get_currently_out(merge_recent_writes(load_latest_logs_cached())))
+    except Exception:
+        return
+
+    st.markdown("<div class='bc-strip-title'>Signed out right now</div>", unsafe_allow_html=True)
+    if df_out is None or df_out.empty:
+        st.markdown("<div class='bc-strip-empty'>Everyone is in camp.</div>", unsafe_allow_html=True)
+        return
+
+    active_html, forgot_html = whos_out_strip_html(df_out)
+    if active_html:
+        st.markdown(active_html, unsafe_allow_html=True)
+    if forgot_html:
+        st.markdown(forgot_html, unsafe_allow_html=True)
 
 
 def page_sign_in_out(staff_pins: dict, staff_names: list):
@@ -2596,13 +3199,19 @@ def page_sign_in_out(staff_pins: dict, staff_names: list):
 
     if submitted:
         name, err = resolve_code(code, pin_lookup)
+        info = None
+        if not err:
+            # Decide direction from a FRESH read, never the cache. This is
+            # a toggle, so a stale read would not just show old data, it
+            # would flip the wrong way and sign someone OUT twice. If the
+            # read fails, do nothing rather than guess.
+            try:
+                info = get_status_fresh(name)
+            except Exception:
+                err = "Could not check your status with the sheet. Please try again."
         if err:
             st.error(err)
         else:
-            # Decide direction from a FRESH read, never the cache. This is
-            # a toggle, so a stale read would not just show old data, it
-            # would flip the wrong way and sign someone OUT twice.
-            info = get_status_fresh(name)
             is_out = bool(info and info["status"] == "OUT")
 
             if is_out:
@@ -2671,8 +3280,8 @@ def page_whos_out():
 
     @st.fragment(run_every=BOARD_REFRESH_SECONDS)
     def live_board():
-        df_logs = merge_recent_writes(load_logs_df_cached())
-        df_out = get_currently_out(df_logs)
+        df_logs = merge_recent_writes(load_latest_logs_cached())
+        df_out = with_minutes_late(get_currently_out(df_logs))
 
         # Alert on anyone who just crossed their deadline. Runs on the board's
         # one-minute tick, deduped in the sheet so it fires only once.
@@ -2685,9 +3294,7 @@ def page_whos_out():
         if df_out.empty:
             empty_note("No staff are currently signed out.")
         else:
-            forgot_mask = df_out.apply(
-                lambda r: row_minutes_late(r) >= FORGOT_THRESHOLD_MINUTES, axis=1
-            )
+            forgot_mask = df_out["mins_late"] >= FORGOT_THRESHOLD_MINUTES
             active = df_out[~forgot_mask]
             forgot = df_out[forgot_mask]
 
@@ -2715,18 +3322,12 @@ def page_whos_out():
     crest_footer()
 
 
-def van_out_since(vans_df, van_name):
+def van_out_since(status_map: dict, van_name):
     """Who took this van and when, from its latest checkout row."""
-    try:
-        tmp = _sorted_by_recency(vans_df)
-        rows = tmp[tmp["van"] == van_name]
-        if rows.empty:
-            return "", None
-        outs = rows[rows["status"].astype(str).str.upper() == "OUT"]
-        src = outs.iloc[-1] if not outs.empty else rows.iloc[-1]
-        return str(src.get("driver", "")).strip(), src.get("timestamp")
-    except Exception:
+    src = status_map.get(van_name, {}).get("checkout")
+    if not src:
         return "", None
+    return src["driver"], src["timestamp"]
 
 
 GAS_LEVELS = {
@@ -2736,6 +3337,7 @@ GAS_LEVELS = {
     "1/4": (0.25, "#D08114"),
     "Low / Empty": (0.10, "#B3261E"),
 }
+GAS_OPTIONS = tuple(GAS_LEVELS)
 
 
 def gas_tank_svg(level_word: str) -> str:
@@ -2802,6 +3404,18 @@ def render_van_tiles(status_map: dict, selected: str = ""):
     st.markdown(f"<div class='bc-vangrid'>{''.join(tiles)}</div>", unsafe_allow_html=True)
 
 
+def pick_van(v: str):
+    """Van button callback. Callbacks run before the rerun a click triggers, so
+    the page draws once with the new pick, instead of drawing the old state
+    and then paying for a second full run through st.rerun()."""
+    st.session_state["van_selected"] = v
+    st.session_state["van_selected_at"] = datetime.now(TZ)
+
+
+def clear_van_pick():
+    st.session_state["van_selected"] = ""
+
+
 def page_vans(staff_pins: dict, staff_names: list, driver_names: list):
     page_title("Camp Vehicles", "Vans")
 
@@ -2839,10 +3453,7 @@ def page_vans(staff_pins: dict, staff_names: list, driver_names: list):
     cols = st.columns(len(VANS))
     for i, v in enumerate(VANS):
         with cols[i]:
-            if st.button(van_label(v), key=f"vanpick_{v}", use_container_width=True):
-                st.session_state["van_selected"] = v
-                st.session_state["van_selected_at"] = datetime.now(TZ)
-                st.rerun()
+            st.button(van_label(v), key=f"vanpick_{v}", use_container_width=True, on_click=pick_van, args=(v,))
 
     if not selected:
         st.divider()
@@ -2855,7 +3466,7 @@ def page_vans(staff_pins: dict, staff_names: list, driver_names: list):
 
     # ---------------- BRING A VAN BACK ----------------
     if is_out:
-        took_driver, took_at = van_out_since(vans_df, selected)
+        took_driver, took_at = van_out_since(status_map, selected)
         sub = f"Taken by {took_driver}" if took_driver else "Bringing it back to camp"
         if took_at is not None:
             when = format_board_time(pd.to_datetime(took_at, errors="coerce"))
@@ -2866,12 +3477,10 @@ def page_vans(staff_pins: dict, staff_names: list, driver_names: list):
         pin_lookup_in = build_pin_lookup(staff_pins)
         with st.form(f"van_back_form_{van_nonce}", clear_on_submit=True):
             back_code = st.text_input("Your code", type="password", max_chars=4)
-            gas_left = st.selectbox("Gas left", ["Full", "3/4", "Half", "1/4", "Low / Empty"])
+            gas_left = st.selectbox("Gas left", GAS_OPTIONS)
             back_go = st.form_submit_button(f"Bring {van_label(selected)} Back", use_container_width=True)
 
-        if st.button("Pick a different van", key="van_cancel_in"):
-            st.session_state["van_selected"] = ""
-            st.rerun()
+        st.button("Pick a different van", key="van_cancel_in", on_click=clear_van_pick)
 
         if back_go:
             def do_bring_back():
@@ -2882,23 +3491,15 @@ def page_vans(staff_pins: dict, staff_names: list, driver_names: list):
                     st.error(err)
                     return
 
-                fresh_df = load_vans_df_cached()
-                if compute_van_status(fresh_df).get(selected, {}).get("status") != "OUT":
+                # Same read the page drew from: this handler runs in the same
+                # rerun, so a second load would only hand back that cached copy.
+                if status_map.get(selected, {}).get("status") != "OUT":
                     st.error(f"{van_label(selected)} is already signed in.")
                     return
 
-                last_purpose = ""
-                last_other = ""
-                try:
-                    tmp = _sorted_by_recency(fresh_df)
-                    vr = tmp[tmp["van"] == selected]
-                    if not vr.empty:
-                        outs = vr[vr["status"].astype(str).str.upper() == "OUT"]
-                        src = outs.iloc[-1] if not outs.empty else vr.iloc[-1]
-                        last_purpose = str(src.get("purpose", "")).strip()
-                        last_other = str(src.get("other_purpose", "")).strip()
-                except Exception:
-                    pass
+                checkout = status_map.get(selected, {}).get("checkout", {})
+                last_purpose = checkout.get("purpose", "")
+                last_other = checkout.get("other_purpose", "")
 
                 row = {
                     "id": str(uuid.uuid4())[:8],
@@ -2924,24 +3525,14 @@ def page_vans(staff_pins: dict, staff_names: list, driver_names: list):
                 )
 
                 # Free everyone the van stranded on the camp board, read live.
-                try:
-                    freed = signin_everyone_on_van(selected)
-                except Exception:
-                    freed = []
-                    st.warning("Van signed in, but linking riders back to the Who's Out board hit a snag.")
-
                 # The person returning it is back at camp too, even if they
                 # were not the one the van signed out.
                 try:
-                    if who not in freed:
-                        info = get_status_fresh(who)
-                        if info and info["status"] == "OUT" and info["reason"] == "Van":
-                            append_log_row(who, "Van", info["other_reason"], action="IN", status="IN", notify=False)
-                            freed = freed + [who]
+                    freed = signin_everyone_on_van(selected, returner=who)
+                    note = f" {len(freed)} signed back in at camp." if freed else ""
                 except Exception:
-                    pass
-
-                note = f" {len(freed)} signed back in at camp." if freed else ""
+                    # Shown in the flash, since a warning here is lost on rerun.
+                    note = " Could not reach the sheet to sign riders back in at camp; do it on the sign page."
                 st.session_state["van_form_nonce"] += 1
                 st.session_state["van_selected"] = ""
                 st.session_state["van_flash"] = f"{van_label(selected)} is back. Gas: {gas_left}.{note}"
@@ -2971,9 +3562,7 @@ def page_vans(staff_pins: dict, staff_names: list, driver_names: list):
                 other_purpose = st.text_input("Other purpose (required)")
             take_go = st.form_submit_button(f"Take {van_label(selected)} Out", use_container_width=True)
 
-        if st.button("Pick a different van", key="van_cancel_out"):
-            st.session_state["van_selected"] = ""
-            st.rerun()
+        st.button("Pick a different van", key="van_cancel_out", on_click=clear_van_pick)
 
         if take_go:
             def do_take_out():
@@ -2987,7 +3576,7 @@ def page_vans(staff_pins: dict, staff_names: list, driver_names: list):
                     return
 
                 # Guard against two people grabbing the same van at once.
-                if compute_van_status(load_vans_df_cached()).get(selected, {}).get("status") == "OUT":
+                if status_map.get(selected, {}).get("status") == "OUT":
                     st.error(f"{van_label(selected)} was taken a moment ago. Pick another van.")
                     return
 
@@ -3021,7 +3610,7 @@ def page_vans(staff_pins: dict, staff_names: list, driver_names: list):
                     signed = auto_signout_for_van([driver], selected)
                     camp_note = f" {driver} signed out of camp." if signed else f" {driver} was already signed out."
                 except Exception:
-                    st.warning("Van saved and alert sent, but linking the driver to the Who's Out board hit a snag.")
+                    camp_note = f" Could not reach the sheet to sign {driver} out of camp; do it on the sign page."
 
                 st.session_state["van_form_nonce"] += 1
                 st.session_state["van_selected"] = ""
@@ -3032,6 +3621,41 @@ def page_vans(staff_pins: dict, staff_names: list, driver_names: list):
 
     crest_footer()
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def admin_history_table(df_logs: pd.DataFrame, time_strs: pd.Series) -> tuple:
+    """The admin Full Log History table, oldest first and renamed for display,
+    plus its CSV bytes for the download. Returns (table, csv_bytes).
+
+    Cached on the log contents, so every admin rerun with an unchanged log
+    (each click anywhere on that page) skips the sort, rename, column shuffle
+    and CSV encoding, and the log is hashed once per rerun for all of it. The
+    page shows the tail of the table. Only the timestamp column, already
+    parsed by the loader, is sorted.
+    """
+    pos = pd.Series(df_logs["timestamp"].to_numpy()).sort_values(na_position="first", kind="stable").index
+    rows = df_logs.iloc[pos]
+    cols_show = {
+        "id": "ID",
+        "timestamp_str": "Time",
+        "name": "Name",
+        "reason": "Reason",
+        "other_reason": "Other Details",
+        "action": "Action",
+        "status": "Status",
+        "late": "Late",
+    }
+    data = {}
+    for c, label in cols_show.items():
+        if c == "timestamp_str":
+            data[label] = time_strs.iloc[pos]
+        elif c in rows.columns:
+            data[label] = rows[c]
+        else:
+            data[label] = ""
+    table = pd.DataFrame(data, index=rows.index)
+    return table, table.to_csv(index=False).encode("utf-8")
+
+
 def page_admin_history(staff_pins: dict):
     page_title("Office Use Only", "Admin / History")
     ADMIN_PASSWORD = st.secrets.get("admin_password", "")
@@ -3041,16 +3665,20 @@ def page_admin_history(staff_pins: dict):
 
     if not st.session_state.admin_authenticated:
         st.info("Admin access is password protected.")
-        pw = st.text_input("Enter admin password", type="password", key="admin_pw_input")
-        col_pw_btn, _ = st.columns([1, 3])
-        with col_pw_btn:
-            if st.button("Unlock Admin", key="admin_pw_btn"):
-                if pw == ADMIN_PASSWORD and ADMIN_PASSWORD != "":
-                    st.session_state.admin_authenticated = True
-                    st.success("Access granted.")
-                    st.rerun()
-                else:
-                    st.error("Incorrect password (or admin_password not set in secrets).")
+        # In a form, like the code boxes, so the password field does not rerun
+        # the page on its own and Enter in the box unlocks directly.
+        with st.form("admin_pw_form", clear_on_submit=True):
+            pw = st.text_input("Enter admin password", type="password", key="admin_pw_input")
+            col_pw_btn, _ = st.columns([1, 3])
+            with col_pw_btn:
+                unlock = st.form_submit_button("Unlock Admin")
+        if unlock:
+            if ADMIN_PASSWORD != "" and hmac.compare_digest(pw.encode(), str(ADMIN_PASSWORD).encode()):
+                st.session_state.admin_authenticated = True
+                st.success("Access granted.")
+                st.rerun()
+            else:
+                st.error("Incorrect password (or admin_password not set in secrets).")
         st.stop()
 
     with st.expander("Admin Session", expanded=False):
@@ -3067,11 +3695,21 @@ def page_admin_history(staff_pins: dict):
     if admin_flash:
         st.success(admin_flash)
 
+    # One read of each tab serves the whole page. Every admin write below ends
+    # in st.rerun(), so no section can be left looking at a stale copy.
+    df_logs = load_logs_df_cached()
+    df_vans = load_vans_df_cached()
+
     section_title("Sign Someone Back In")
     st.caption("For when a staff member forgot to sign in. Pick the person, type your admin code, and sign them in.")
 
-    df_out_now = get_currently_out(load_logs_df_cached())
-    out_names_now = sorted(df_out_now["name"].tolist())
+    # One row per person who is out, keyed by name. Names are unique here
+    # (latest row per person), so the submit below is a dict lookup rather
+    # than a scan of the out list. Taken from the per-revision latest rows, so
+    # the admin page does not re-sort the whole log to find who is out.
+    df_out_now = get_currently_out(load_latest_logs_cached())
+    out_rows_now = dict(zip(df_out_now["name"].tolist(), df_out_now.to_dict("records")))
+    out_names_now = sorted(out_rows_now)
 
     if not out_names_now:
         empty_note("No staff are currently signed out.")
@@ -3086,7 +3724,7 @@ def page_admin_history(staff_pins: dict):
             if err:
                 st.error(err)
             else:
-                row = df_out_now[df_out_now["name"] == who].iloc[0]
+                row = out_rows_now[who]
                 # An admin fixing the board must still record that they were
                 # late, recomputed from the current reason.
                 mins = row_minutes_late(row)
@@ -3111,8 +3749,7 @@ def page_admin_history(staff_pins: dict):
     section_title("Sign a Van Back In")
     st.caption("For when a van was left showing out. Pick the van, type your admin code, and sign it in.")
 
-    vans_now = load_vans_df_cached()
-    status_now = compute_van_status(vans_now)
+    status_now = compute_van_status(df_vans)
     out_vans_now = [v for v in VANS if status_now.get(v, {}).get("status") == "OUT"]
 
     if not out_vans_now:
@@ -3129,22 +3766,10 @@ def page_admin_history(staff_pins: dict):
                 st.error(err)
             else:
                 # Pull the van's original checkout so we can free its driver too.
-                orig_driver = ""
-                last_purpose = ""
-                last_other_purpose = ""
-                try:
-                    tmp = vans_now.copy()
-                    tmp["timestamp"] = pd.to_datetime(tmp["timestamp"], errors="coerce")
-                    tmp = tmp.sort_values("timestamp", na_position="last")
-                    vr = tmp[tmp["van"] == which_van]
-                    if not vr.empty:
-                        outr = vr[vr["status"].astype(str).str.upper() == "OUT"]
-                        src = outr.iloc[-1] if not outr.empty else vr.iloc[-1]
-                        orig_driver = str(src.get("driver", "")).strip()
-                        last_purpose = str(src.get("purpose", "")).strip()
-                        last_other_purpose = str(src.get("other_purpose", "")).strip()
-                except Exception:
-                    pass
+                checkout = status_now.get(which_van, {}).get("checkout", {})
+                orig_driver = checkout.get("driver", "")
+                last_purpose = checkout.get("purpose", "")
+                last_other_purpose = checkout.get("other_purpose", "")
 
                 van_row = {
                     "id": str(uuid.uuid4())[:8],
@@ -3165,13 +3790,14 @@ def page_admin_history(staff_pins: dict):
                     st.stop()
 
                 # Free everyone stranded under this van's tag, read live.
+                riders_note = ""
                 try:
                     signin_everyone_on_van(which_van)
                 except Exception:
-                    pass
+                    riders_note = " Could not reach the sheet to sign its riders back in at camp."
 
                 notify_vans("Bauercrest: Van IN", f"{van_label(which_van)} signed in by admin {admin_name}")
-                st.session_state["admin_flash"] = f"{van_label(which_van)} signed in by {admin_name}."
+                st.session_state["admin_flash"] = f"{van_label(which_van)} signed in by {admin_name}.{riders_note}"
                 st.rerun()
 
     st.markdown("---")
@@ -3244,64 +3870,38 @@ def page_admin_history(staff_pins: dict):
 
     st.markdown("---")
 
-    df_logs = load_logs_df_cached()
+    # The history table and the delete picker below both show each row's time.
+    # Format the column once for the whole frame and let both read from it.
+    log_time_strs = format_time_series(df_logs["timestamp"]) if not df_logs.empty else pd.Series(dtype=str)
 
     section_title("Full Log History")
     if df_logs.empty:
         st.info("No logs recorded yet.")
     else:
-        # Show only the most recent rows so this table stays fast no matter how
-        # large the live tab is. The complete record is always available through
-        # the full-history download and the archive tab.
-        HISTORY_TABLE_LIMIT = 200
         total_rows = len(df_logs)
-        df_display = df_logs.copy()
-        df_display["_ts"] = pd.to_datetime(df_display["timestamp"], errors="coerce", format="mixed")
-        df_display = df_display.sort_values("_ts", na_position="first").drop(columns=["_ts"])
         if total_rows > HISTORY_TABLE_LIMIT:
-            df_display = df_display.tail(HISTORY_TABLE_LIMIT)
             st.caption(f"Showing the most recent {HISTORY_TABLE_LIMIT} of {total_rows} live rows. Use the downloads for the full record.")
-        df_display["timestamp_str"] = df_display["timestamp"].apply(format_time)
-        df_display = df_display.rename(columns={
-            "id": "ID",
-            "timestamp_str": "Time",
-            "name": "Name",
-            "reason": "Reason",
-            "other_reason": "Other Details",
-            "action": "Action",
-            "status": "Status",
-            "late": "Late",
-        })
-        cols_show = ["ID", "Time", "Name", "Reason", "Other Details", "Action", "Status", "Late"]
-        for c in cols_show:
-            if c not in df_display.columns:
-                df_display[c] = ""
-        df_display = df_display[cols_show]
-        st.dataframe(df_display, use_container_width=True)
+        # The download is every live row; the table shows just the newest.
+        df_full, full_csv = admin_history_table(df_logs, log_time_strs)
+        st.dataframe(df_full.tail(HISTORY_TABLE_LIMIT), use_container_width=True)
 
         st.download_button(
             "Download Full Log as CSV",
-            data=df_display.to_csv(index=False),
+            data=full_csv,
             file_name="signout_log.csv",
             mime="text/csv",
         )
 
     st.markdown("---")
-    df_vans = load_vans_df_cached()
     section_title("Van Log History")
     if df_vans is None or df_vans.empty:
         st.info("No van logs recorded yet.")
     else:
-        dfv = df_vans.copy()
-        if "timestamp" in dfv.columns:
-            dfv["timestamp"] = pd.to_datetime(dfv["timestamp"], errors="coerce")
-            dfv["timestamp_str"] = dfv["timestamp"].apply(format_time)
-        else:
-            dfv["timestamp_str"] = ""
-
-        dfv = dfv.rename(columns={
+        # Built from the shown columns only, rather than a full copy of the
+        # van log that is then renamed and cut down.
+        van_cols = {
             "id": "ID",
-            "timestamp_str": "Time",
+            "timestamp": "Time",
             "van": "Van",
             "driver": "Driver",
             "purpose": "Purpose",
@@ -3310,13 +3910,22 @@ def page_admin_history(staff_pins: dict):
             "action": "Action",
             "status": "Status",
             "gas_left": "Gas Left",
-        })
-        cols = [c for c in ["ID", "Time", "Van", "Driver", "Purpose", "Passengers", "Other Purpose", "Action", "Status", "Gas Left"] if c in dfv.columns]
-        st.dataframe(dfv[cols], use_container_width=True)
+        }
+        van_data = {}
+        for c, label in van_cols.items():
+            if c == "timestamp":
+                van_data[label] = format_time_series(df_vans[c]) if c in df_vans.columns else ""
+            elif c in df_vans.columns:
+                van_data[label] = df_vans[c]
+        dfv = pd.DataFrame(van_data, index=df_vans.index)
+        # Rows are appended in time order, so the tail is the newest.
+        if len(dfv) > HISTORY_TABLE_LIMIT:
+            st.caption(f"Showing the most recent {HISTORY_TABLE_LIMIT} of {len(dfv)} van rows. Use the download for the full record.")
+        st.dataframe(dfv.tail(HISTORY_TABLE_LIMIT), use_container_width=True)
 
         st.download_button(
             "Download Van Log as CSV",
-            data=dfv[cols].to_csv(index=False),
+            data=frame_csv_bytes(dfv),
             file_name="van_log.csv",
             mime="text/csv",
         )
@@ -3327,26 +3936,36 @@ def page_admin_history(staff_pins: dict):
     if df_logs.empty:
         st.info("No deletable entries.")
     else:
-        id_to_label = {}
-        for _, row in df_logs.iterrows():
-            rid = str(row.get("id", "")).strip()
-            if not rid:
-                continue
-            label = f"{rid} – {row.get('name','')} – {format_time(row.get('timestamp'))} – {row.get('action','')}"
-            id_to_label[rid] = label
-
-        selected_labels = st.multiselect(
-            "Select entries to delete",
-            list(id_to_label.values()),
-            key="admin_delete_specific_multiselect",
+        ids = df_logs["id"].astype(str).str.strip()
+        # Whole-column string concatenation, then one zip into the dict.
+        labels = (
+            ids + " – " + df_logs["name"].astype(str) + " – " + log_time_strs
+            + " – " + df_logs["action"].astype(str)
         )
+        has_id = ids != ""
+        id_to_label = dict(zip(ids[has_id].tolist(), labels[has_id].tolist()))
+        # Reverse map, so turning the picked labels back into ids is a lookup
+        # per pick rather than a scan of every label in the log.
+        label_to_id = {label: rid for rid, label in id_to_label.items()}
+
+        # In a form, so picking entries does not rerun the whole admin page
+        # (and rebuild every label) on each click. Only the submit does.
+        with st.form("admin_delete_specific_form"):
+            selected_labels = st.multiselect(
+                "Select entries to delete",
+                list(id_to_label.values()),
+                key="admin_delete_specific_multiselect",
+            )
+            do_delete = st.form_submit_button("Delete Selected Entries")
 
-        selected_ids = [log_id for log_id, label in id_to_label.items() if label in selected_labels]
-
-        if selected_ids and st.button("Delete Selected Entries", key="admin_delete_specific_button"):
-            delete_logs_by_ids(selected_ids)
-            st.success(f"Deleted {len(selected_ids)} log(s).")
-            st.rerun()
+        if do_delete:
+            selected_ids = [label_to_id[label] for label in selected_labels if label in label_to_id]
+            if not selected_ids:
+                st.warning("Pick at least one entry to delete.")
+            else:
+                delete_logs_by_ids(selected_ids)
+                st.success(f"Deleted {len(selected_ids)} log(s).")
+                st.rerun()
 
     st.markdown("---")
     section_title("Delete ALL Logs (for testing / pre-season only)")
@@ -3363,20 +3982,19 @@ def page_admin_history(staff_pins: dict):
 # =================================================
 # MAIN
 # =================================================
+@st.cache_resource(show_spinner=False)
 def ensure_headers_once():
-    """Fix the logs and vans header rows a single time per session.
+    """Fix the logs and vans header rows a single time per server process.
 
     Headers used to be re-checked on every read and write, a network call each
-    time. They only need checking once, so this runs at startup and then never
-    again for the session. Wrapped and time-boxed so a slow Google response
-    cannot freeze the kiosk on a blank screen; if it does not finish, the app
-    still loads and the write paths ensure headers anyway.
+    time. They only need checking once: the header row changes only when
+    someone edits the sheet by hand, and every reader already tolerates a
+    messy header. As a cache resource this runs for the first kiosk to load
+    after the app starts and is a no-op for every later session and reload,
+    where it used to re-run per browser session. A failure is swallowed and
+    not retried, same as before, so a slow Google response cannot keep
+    re-blocking page loads.
     """
-    if st.session_state.get("_headers_ensured"):
-        return
-    # Mark done FIRST. If a call below is slow and the user reloads, we do not
-    # want to re-run this heavy startup step every time.
-    st.session_state["_headers_ensured"] = True
     try:
         ensure_logs_header(get_worksheet(SHEET_LOGS))
         ensure_vans_header(get_vans_sheet())
@@ -3385,6 +4003,7 @@ def ensure_headers_once():
         get_van_headers.clear()
     except Exception:
         pass
+    return True
 
 
 def _main_body():
@@ -3412,7 +4031,7 @@ def _main_body():
 
     page = st.sidebar.radio(
         "Go to",
-        ["Sign In / Out", "Who's Out", "Vans", "Admin / History"],
+        PAGES,
         key="main_page_radio",
     )
 
@@ -3464,7 +4083,7 @@ def _main_body():
         @st.fragment(run_every=BOARD_REFRESH_SECONDS)
         def heartbeat():
             try:
-                out_now = get_currently_out(merge_recent_writes(load_logs_df_cached()))
+                out_now = get_currently_out(merge_recent_writes(load_latest_logs_cached()))
                 check_late_and_alert(out_now)
                 check_nightly_summary(out_now)
             except Exception: